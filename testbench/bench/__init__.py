@@ -0,0 +1 @@
+"""Benchmark suite: simulator-free hot paths and end-to-end GHDL throughput."""
@@ -0,0 +1,31 @@
+"""End-to-end throughput benchmarks: one frame through the passthrough DUT per size.
+
+Run through ``tb-bench run --e2e``, which simulates this module with waves off and
+reads per-test wall time and received pixels from the profiling report.
+"""
+
+from __future__ import annotations
+
+import cocotb
+from models.image_model import Image
+from tests.test_passthrough import PassthroughCaseConfig, PassthroughTestbench
+
+
+async def _run_size(dut, width: int, height: int) -> None:
+    tb = PassthroughTestbench(dut=dut, cfg=PassthroughCaseConfig())
+    await tb.run_frame(image=Image.gradient(width=width, height=height))
+
+
+@cocotb.test()
+async def bench_passthrough_64x64(dut) -> None:
+    await _run_size(dut, 64, 64)
+
+
+@cocotb.test(timeout_time=50, timeout_unit="ms")
+async def bench_passthrough_512x512(dut) -> None:
+    await _run_size(dut, 512, 512)
+
+
+@cocotb.test(timeout_time=200, timeout_unit="ms")
+async def bench_passthrough_1920x1080(dut) -> None:
+    await _run_size(dut, 1920, 1080)
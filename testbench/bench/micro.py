@@ -0,0 +1,169 @@
+"""Simulator-free benchmarks of the testbench hot paths.
+
+Each benchmark factory prepares its inputs once and returns the callable to time plus
+the number of pixels one call processes.
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from cocotbext.axi import AxiStreamFrame
+from common.packing import decode_line, line_frames
+from models.golden_model import (
+    GRAYSCALE_RGB,
+    BoxBlur3x3,
+    Grayscale,
+    Pipeline,
+    SobelMagnitude,
+    Threshold,
+)
+from models.image_model import Image
+from verification.digest_scoreboard import FrameDigest
+from verification.scoreboard import Scoreboard, Tolerance
+
+TESTBENCH_ROOT = Path(__file__).resolve().parents[1]
+IMAGES_DIR = TESTBENCH_ROOT / "images"
+
+Workload = tuple[Callable[[], object], int]
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    name: str
+    seconds: float
+    """Median wall time of one call."""
+
+    min_seconds: float
+    pixels: int
+
+    @property
+    def pixels_per_s(self) -> float:
+        return self.pixels / self.seconds if self.seconds > 0 else 0.0
+
+
+def _received_lines(image: Image) -> list[AxiStreamFrame]:
+    """Line packets as cocotbext-axi's sink hands them over (bytearray tdata)."""
+    lanes = np.ascontiguousarray(image.pixels[:, :, ::-1])
+    return [AxiStreamFrame(tdata=bytearray(row.tobytes())) for row in lanes]
+
+
+def _source_pack(image: Image, byte_lanes: int = 3) -> Workload:
+    def run() -> None:
+        for _ in line_frames(image, byte_lanes, has_tkeep=True):
+            pass
+
+    return run, image.width * image.height
+
+
+def _sink_decode(image: Image, byte_lanes: int = 3) -> Workload:
+    lines = _received_lines(image)
+    frame = np.empty_like(image.pixels)
+
+    def run() -> None:
+        for y, line in enumerate(lines):
+            decode_line(line.tdata, image.width, byte_lanes=byte_lanes, out=frame[y])
+
+    return run, image.width * image.height
+
+
+def _from_png(path: Path) -> Workload:
+    image = Image.from_png(path)
+    return (lambda: Image.from_png(path)), image.width * image.height
+
+
+def _pipeline(pipeline: Pipeline, image: Image) -> Workload:
+    return (lambda: pipeline.apply(image)), image.width * image.height
+
+
+def _compare_equal(image: Image) -> Workload:
+    received = Image.wrap(image.pixels.copy())
+    scoreboard = Scoreboard()
+    return (lambda: scoreboard.compare(image, received)), image.width * image.height
+
+
+def _compare_off_by_one(image: Image) -> Workload:
+    # Every 7th sample off by one: exercises the full mismatch analytics path.
+    noisy = image.pixels.copy().reshape(-1)
+    noisy[::7] ^= 1
+    received = Image.wrap(noisy.reshape(image.pixels.shape))
+    scoreboard = Scoreboard(Tolerance(max_abs_diff=1))
+    return (lambda: scoreboard.compare(image, received)), image.width * image.height
+
+
+def _line_checker(image: Image) -> Workload:
+    scoreboard = Scoreboard()
+    rows = image.pixels.copy()
+
+    def run() -> None:
+        check = scoreboard.line_checker(image)
+        for y, row in enumerate(rows):
+            check(y, row)
+
+    return run, image.width * image.height
+
+
+def _frame_digest(image: Image) -> Workload:
+    return (lambda: FrameDigest.of(image)), image.width * image.height
+
+
+def micro_benchmarks() -> dict[str, Callable[[], Workload]]:
+    """Registry of benchmark name -> workload factory (inputs are built lazily)."""
+    hd = Image.gradient(width=1920, height=1080)
+    sobel_edges = Pipeline((Grayscale(), BoxBlur3x3(), SobelMagnitude(), Threshold(level=64)))
+    return {
+        "source.line_frames[512x512]": lambda: _source_pack(Image.gradient(512, 512)),
+        "source.line_frames[1920x1080]": lambda: _source_pack(hd),
+        "source.line_frames[1920x1080,4ppc]": lambda: _source_pack(hd, byte_lanes=12),
+        "sink.decode_line[1920x1080]": lambda: _sink_decode(hd),
+        "sink.decode_line[1920x1080,4ppc]": lambda: _sink_decode(hd, byte_lanes=12),
+        "image.from_png[512x512]": lambda: _from_png(IMAGES_DIR / "lenna_512_512.png"),
+        "image.from_png[1920x1080]": lambda: _from_png(IMAGES_DIR / "mountains_1920_1080.png"),
+        "golden.grayscale_rgb[1920x1080]": lambda: _pipeline(GRAYSCALE_RGB, hd),
+        "golden.sobel_edges[1920x1080]": lambda: _pipeline(sobel_edges, hd),
+        "scoreboard.compare_equal[1920x1080]": lambda: _compare_equal(hd),
+        "scoreboard.compare_off_by_one[1920x1080]": lambda: _compare_off_by_one(hd),
+        "scoreboard.line_checker[1920x1080]": lambda: _line_checker(hd),
+        "digest.frame_digest[1920x1080]": lambda: _frame_digest(hd),
+    }
+
+
+def measure(
+    name: str,
+    workload: Workload,
+    *,
+    repeat: int = 5,
+    min_time_s: float = 0.2,
+) -> Measurement:
+    """Time ``workload`` ``repeat`` times, each sample looping for at least ``min_time_s``."""
+    func, pixels = workload
+    func()  # warm-up (imports, caches, allocator)
+
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time_s or loops >= 1 << 20:
+            break
+        loops *= 2
+
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+
+    return Measurement(
+        name=name,
+        seconds=statistics.median(samples),
+        min_seconds=min(samples),
+        pixels=pixels,
+    )
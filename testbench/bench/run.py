@@ -0,0 +1,197 @@
+"""``tb-bench``: run benchmarks, store JSON baselines and flag regressions."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import re
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from sim.run import profile_target
+
+from bench.micro import measure, micro_benchmarks
+
+TESTBENCH_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_RESULTS = TESTBENCH_ROOT / "sim_build" / "bench" / "results.json"
+DEFAULT_BASELINE = TESTBENCH_ROOT / "bench" / "baselines" / "baseline.json"
+DEFAULT_THRESHOLD = 0.15
+E2E_TARGET = "example_passthrough"
+E2E_TEST_MODULE = "bench.e2e_throughput"
+
+
+def _run_micro(pattern: re.Pattern[str], repeat: int) -> dict[str, dict[str, Any]]:
+    results = {}
+    for name, factory in micro_benchmarks().items():
+        if not pattern.search(name):
+            continue
+        measurement = measure(name, factory(), repeat=repeat)
+        results[name] = {
+            "seconds": measurement.seconds,
+            "min_seconds": measurement.min_seconds,
+            "pixels_per_s": measurement.pixels_per_s,
+        }
+        print(
+            f"{name:44s} {measurement.seconds * 1e3:10.3f} ms "
+            f"{measurement.pixels_per_s / 1e6:10.2f} Mpx/s",
+        )
+    return results
+
+
+def _run_e2e(pattern: re.Pattern[str]) -> dict[str, dict[str, Any]]:
+    """Simulate ``bench.e2e_throughput`` against the passthrough target, waves off."""
+    profile = profile_target(
+        E2E_TARGET,
+        overrides={
+            "target": f"bench_{E2E_TARGET}",
+            "test_module": E2E_TEST_MODULE,
+            "waves": "off",
+        },
+    )
+
+    results = {}
+    for test in profile.tests:
+        name = f"e2e.{test.test.removeprefix('bench_')}"
+        if not pattern.search(name):
+            continue
+        results[name] = {
+            "seconds": test.wall_time_s,
+            "min_seconds": test.wall_time_s,
+            "pixels_per_s": test.pixels_per_s,
+            "cycles_per_s": test.cycles_per_s,
+        }
+        print(
+            f"{name:44s} {test.wall_time_s * 1e3:10.1f} ms "
+            f"{test.pixels_per_s / 1e3:10.2f} kpx/s {test.cycles_per_s / 1e3:10.2f} kcycles/s",
+        )
+    return results
+
+
+def _environment() -> dict[str, str]:
+    return {
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"Wrote {path}")
+
+
+def compare_results(
+    results: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float,
+) -> list[str]:
+    """Print a comparison table and return the names of regressed benchmarks.
+
+    A benchmark regresses when its median time exceeds the baseline by more than
+    ``threshold`` (a fraction, e.g. 0.15 for 15%).
+    """
+    current = results["benchmarks"]
+    reference = baseline["benchmarks"]
+    regressions = []
+    print(f"{'benchmark':44s} {'baseline':>12s} {'current':>12s} {'change':>8s}")
+    for name in sorted(current.keys() | reference.keys()):
+        if name not in reference or name not in current:
+            state = "new" if name not in reference else "missing"
+            print(f"{name:44s} {state:>34s}")
+            continue
+        before = reference[name]["seconds"]
+        after = current[name]["seconds"]
+        change = after / before - 1.0 if before > 0 else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:44s} {before * 1e3:10.3f}ms {after * 1e3:10.3f}ms {change:+8.1%}{flag}")
+    return regressions
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    pattern = re.compile(args.filter or "")
+    benchmarks: dict[str, dict[str, Any]] = {}
+    if not args.e2e_only:
+        benchmarks.update(_run_micro(pattern, repeat=args.repeat))
+    if args.e2e or args.e2e_only:
+        benchmarks.update(_run_e2e(pattern))
+
+    results = {**_environment(), "benchmarks": benchmarks}
+    _write_json(args.output, results)
+    if args.save_baseline:
+        _write_json(args.baseline, results)
+    if args.compare:
+        return _compare_files(args.output, args.baseline, args.threshold)
+    return 0
+
+
+def _compare_files(results_path: Path, baseline_path: Path, threshold: float) -> int:
+    if not baseline_path.is_file():
+        print(f"No baseline at {baseline_path}; create one with 'tb-bench run --save-baseline'.")
+        return 2
+    results = json.loads(results_path.read_text(encoding="utf-8"))
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    regressions = compare_results(results, baseline, threshold)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {threshold:.0%}.")
+        return 1
+    return 0
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Testbench benchmark suite.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run benchmarks and write a results JSON.")
+    run.add_argument("-k", "--filter", help="Only run benchmarks whose name matches this regex.")
+    run.add_argument("--repeat", type=int, default=5, help="Timing samples per benchmark.")
+    run.add_argument(
+        "--e2e",
+        action="store_true",
+        help="Also run the GHDL end-to-end benchmarks (64x64, 512x512, 1920x1080).",
+    )
+    run.add_argument("--e2e-only", action="store_true", help="Run only the GHDL benchmarks.")
+    run.add_argument("--output", type=Path, default=DEFAULT_RESULTS)
+    run.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    run.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Also store the results as the baseline.",
+    )
+    run.add_argument(
+        "--compare",
+        action="store_true",
+        help="Compare against the baseline and exit non-zero on regressions.",
+    )
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare = commands.add_parser("compare", help="Compare a results JSON with a baseline.")
+    compare.add_argument("results", type=Path, nargs="?", default=DEFAULT_RESULTS)
+    compare.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown as a fraction (default: 0.15).",
+    )
+    return parser
+
+
+def main() -> None:
+    args = _build_arg_parser().parse_args()
+    if args.command == "run":
+        sys.exit(_cmd_run(args))
+    sys.exit(_compare_files(args.results, args.baseline, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Worker-pool offload for CPU-heavy test work (golden models, PNG encoding, reports).
+
+The cocotb scheduler thread drives the simulator; whatever it computes stalls the
+simulation. NumPy, zlib and Pillow release the GIL for their heavy lifting, so
+running them on a thread pool lets the simulator advance meanwhile.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+WORKERS_ENV = "TB_WORKERS"
+T = TypeVar("T")
+
+
+@functools.cache
+def default_worker_pool() -> ThreadPoolExecutor:
+    """Process-wide pool; ``TB_WORKERS`` overrides its size (default: min(4, CPUs))."""
+    workers = int(os.getenv(WORKERS_ENV, "0")) or min(4, os.cpu_count() or 1)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tb-offload")
+
+
+def resolve(value: T | Future[T]) -> T:
+    """Return ``value``, waiting for it first if it is a ``Future``."""
+    return value.result() if isinstance(value, Future) else value
+
+
+class Offload:
+    """Background jobs of one test, joined (and their failures raised) at its end.
+
+    ``Future`` arguments are resolved inside the worker, so a job can consume the
+    result of an earlier submission (e.g. compare against an offloaded golden frame).
+    Jobs start in submission order, so such chains cannot deadlock the pool.
+    """
+
+    def __init__(self, pool: Executor | None = None) -> None:
+        self._pool = pool if pool is not None else default_worker_pool()
+        self._jobs: list[Future[Any]] = []
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        def run() -> T:
+            return fn(
+                *(resolve(arg) for arg in args),
+                **{name: resolve(value) for name, value in kwargs.items()},
+            )
+
+        future = self._pool.submit(run)
+        self._jobs.append(future)
+        return future
+
+    def join(self) -> None:
+        """Wait for every job; re-raise the first failure in submission order."""
+        jobs, self._jobs = self._jobs, []
+        failures = [exc for exc in (job.exception() for job in jobs) if exc is not None]
+        if failures:
+            raise failures[0]
+
+    def cancel(self) -> None:
+        """Drop jobs that have not started yet (used when the test already failed)."""
+        for job in self._jobs:
+            job.cancel()
+        self._jobs.clear()
@@ -0,0 +1,115 @@
+"""RGB24 beat packing for AXI4-Stream video with 1, 2 or 4 pixels per clock.
+
+Pixel ``k`` of a beat occupies byte lanes ``3k..3k+2`` (B, G, R), i.e.
+``TDATA[24k+23:24k]`` as ``R:G:B``. A line of ``width`` pixels takes
+``ceil(width / ppc)`` beats; when ``width`` is not a multiple of ``ppc`` the last beat
+of each line is partial and only its valid lanes have ``TKEEP`` set.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+from cocotbext.axi import AxiStreamFrame  # type: ignore[missing-imports]
+from models.image_model import Image
+
+BYTES_PER_PIXEL = 3
+
+
+def pixels_per_clock(byte_lanes: int) -> int:
+    """Pixels carried by one beat of a ``byte_lanes`` wide bus."""
+    if byte_lanes <= 0 or byte_lanes % BYTES_PER_PIXEL:
+        raise ValueError(
+            f"RGB24 video needs a multiple of {BYTES_PER_PIXEL} byte lanes, got {byte_lanes}.",
+        )
+    return byte_lanes // BYTES_PER_PIXEL
+
+
+def line_beats(width: int, ppc: int) -> int:
+    """Beats per line, counting a partial last beat."""
+    return -(-width // ppc)
+
+
+def last_beat_pixels(width: int, ppc: int) -> int:
+    """Valid pixels in the last beat of a line (``ppc`` when the line is aligned)."""
+    return width - (line_beats(width, ppc) - 1) * ppc
+
+
+def keep_mask(pixels: int) -> int:
+    """``TKEEP`` value of a beat whose first ``pixels`` pixels are valid."""
+    return (1 << (BYTES_PER_PIXEL * pixels)) - 1
+
+
+def _sof_tuser(line_bytes_len: int, byte_lanes: int) -> list[int]:
+    """Per-byte TUSER of line 0: SOF on every byte of its first beat.
+
+    cocotbext-axi pads a short TUSER list with its last element, so the trailing
+    zero covers the rest of the line. Marking the whole beat avoids byte-index
+    ambiguity in sideband packing.
+    """
+    return [1] * min(byte_lanes, line_bytes_len) + [0]
+
+
+def line_frames(image: Image, byte_lanes: int, *, has_tkeep: bool) -> Iterator[AxiStreamFrame]:
+    """Pack ``image`` into AXI packets, one per line, in transmit order.
+
+    Without TKEEP a partial last beat cannot be signalled, so every line must fill
+    whole beats.
+    """
+    pixels_per_clock(byte_lanes)
+    line_bytes_len = image.width * BYTES_PER_PIXEL
+    if line_bytes_len % byte_lanes != 0 and not has_tkeep:
+        raise AssertionError(
+            "AXI4-Stream line byte count must align to beat size when tkeep is not modeled: "
+            f"width={image.width}, line_bytes={line_bytes_len}, byte_lanes={byte_lanes}.",
+        )
+
+    # cocotbext-axi packs lane 0 into TDATA[7:0], lane 1 into [15:8], lane 2 into [23:16].
+    # With N pixels per clock the next pixel simply continues at lane 3, so the byte
+    # stream is the same for every PPC.
+    lanes = np.ascontiguousarray(image.pixels[:, :, ::-1], dtype=np.uint8)
+    frame_bytes = memoryview(lanes.reshape(-1))
+
+    for y in range(image.height):
+        start = y * line_bytes_len
+        line_view = frame_bytes[start : start + line_bytes_len]
+        # cocotbext-axi expands a scalar TUSER to every byte, so only line 0 needs a list.
+        tuser = _sof_tuser(line_bytes_len, byte_lanes) if y == 0 else 0
+
+        # Hand over bytes so cocotbext-axi keeps its bytearray fast path; a memoryview
+        # would be expanded into a per-byte Python list.
+        yield AxiStreamFrame(tdata=line_view.tobytes(), tuser=tuser)
+
+
+def decode_line(
+    tdata: bytes | bytearray,
+    width: int,
+    *,
+    byte_lanes: int,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Decode the TDATA bytes of one AXI line into an RGB ``(width, 3)`` uint8 row.
+
+    With TKEEP the sink has already dropped the unused lanes of a partial last
+    beat; without it those lanes arrive as padding and are skipped here.
+
+    When ``out`` is given the pixels are written into it (typically a row view of a
+    preallocated frame buffer) and the same array is returned.
+    """
+    ppc = pixels_per_clock(byte_lanes)
+    expected_bytes = width * BYTES_PER_PIXEL
+    padded_bytes = line_beats(width, ppc) * byte_lanes
+    if len(tdata) not in (expected_bytes, padded_bytes):
+        raise AssertionError(
+            f"Line length mismatch on AXI stream: got {len(tdata)} bytes, "
+            f"expected {expected_bytes}",
+        )
+
+    # Per pixel, lane 0 carries B, lane 1 G, lane 2 R; reversing the lane axis yields RGB.
+    lanes = np.frombuffer(tdata, dtype=np.uint8, count=expected_bytes).reshape(width, 3)
+    if out is None:
+        return lanes[:, ::-1].copy()
+
+    out[...] = lanes[:, ::-1]
+    return out
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import itertools
+from collections.abc import Iterator
 from typing import Any, Protocol
 
-from cocotb.triggers import FallingEdge
+from cocotb.triggers import FallingEdge, Timer
+from cocotb.utils import get_sim_time
+
+PauseRun = tuple[bool, int]
+"""One run-length segment: pause level and its length in clock cycles."""
 
 
 class PauseControllable(Protocol):
@@ -14,33 +19,78 @@ class PauseControllable(Protocol):
     def set_pause(self, paused: bool) -> None: ...
 
 
+def compile_pause_runs(pattern: tuple[int, ...]) -> tuple[PauseRun, ...]:
+    """Compile a per-cycle pattern into ``(paused, cycles)`` runs of one pattern period.
+
+    ``(0, 1, 1, 0, 0, 0)`` becomes ``((False, 1), (True, 2), (False, 3))``.
+    """
+    if not pattern:
+        raise ValueError("Pause pattern must contain at least one element.")
+    return tuple(
+        (level, sum(1 for _ in group))
+        for level, group in itertools.groupby(bool(value) for value in pattern)
+    )
+
+
+def _repeated_runs(runs: tuple[PauseRun, ...]) -> Iterator[PauseRun]:
+    """Repeat ``runs`` forever, merging the last and first run when their levels match."""
+    level, cycles = runs[0]
+    for next_level, next_cycles in itertools.islice(itertools.cycle(runs), 1, None):
+        if next_level == level:
+            cycles += next_cycles
+            continue
+        yield level, cycles
+        level, cycles = next_level, next_cycles
+
+
 async def drive_sink_pause(
     *,
     sink: PauseControllable,
     i_clk: Any,
     pattern: tuple[int, ...],
 ) -> None:
-    """Drive sink pause (`1`=pause, `0`=ready) on falling clock edges."""
-    if not pattern:
-        raise ValueError("Pause pattern must contain at least one element.")
+    """Drive sink pause (`1`=pause, `0`=ready) on falling clock edges.
+
+    The pattern is applied per cycle starting at the first falling edge, exactly as
+    if it were stepped edge by edge, but only level changes wake this coroutine: the
+    clock period is measured on the first two falling edges and each run is then
+    awaited with a single ``Timer``. This assumes a free-running fixed-period clock
+    (``cocotb.clock.Clock``). Works for any ``set_pause`` target, sources included.
+    """
+    runs = compile_pause_runs(pattern)
 
     sink.set_pause(False)
-    pattern_iter = itertools.cycle(pattern)
+    await FallingEdge(i_clk)
+    if len(runs) == 1:
+        # Constant level: nothing ever changes after the first edge.
+        sink.set_pause(runs[0][0])
+        return
+
+    run_iter = _repeated_runs(runs)
+    paused, cycles = next(run_iter)
+    sink.set_pause(paused)
+    first_edge = get_sim_time("step")
+    await FallingEdge(i_clk)
+    period_steps = get_sim_time("step") - first_edge
+    remaining = cycles - 1
 
-    while True:
-        await FallingEdge(i_clk)
-        sink.set_pause(bool(next(pattern_iter)))
+    for paused, cycles in run_iter:
+        if remaining:
+            await Timer(remaining * period_steps, unit="step")
+        sink.set_pause(paused)
+        remaining = cycles
 
 
-def repeating_pause(pattern: tuple[int, ...] = (0, 0, 1, 0)):
+def repeating_pause(pattern: tuple[int, ...] = (0, 0, 1, 0)) -> Iterator[bool]:
     """
     Yield an infinite pause pattern for cocotbext-axi pause generators.
 
     0 -> not paused, 1 -> paused
+
+    cocotbext-axi pulls one value per clock cycle; ``itertools.cycle`` serves those
+    from C without resuming a Python generator frame. To wake only on level changes,
+    give the endpoint's ``set_pause`` to ``drive_sink_pause`` instead.
     """
     if not pattern:
         raise ValueError("Pause pattern must contain at least one element.")
-
-    while True:
-        for value in pattern:
-            yield bool(value)
+    return itertools.cycle(tuple(bool(value) for value in pattern))
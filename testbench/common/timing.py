@@ -0,0 +1,107 @@
+"""Beat timestamp recording and throughput logging for AXI4-Stream endpoints."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import cocotb
+import numpy as np
+from cocotb.triggers import RisingEdge, Timer
+from cocotb.utils import get_sim_steps, get_sim_time
+
+PIXEL_LOG_ENV = "TB_PIXEL_LOG"
+"""Set by ``tb-sim --profile`` to a JSON-lines file receiving one entry per frame."""
+
+_PIXEL_LOG_PATH = os.getenv(PIXEL_LOG_ENV)
+
+
+def log_frame_pixels(pixels: int) -> None:
+    """Record a received frame for the runner's pixels-per-second report (if enabled)."""
+    if not _PIXEL_LOG_PATH:
+        return
+    with open(_PIXEL_LOG_PATH, "a", encoding="utf-8") as log:
+        log.write(json.dumps({"sim_time_ns": get_sim_time("ns"), "pixels": pixels}) + "\n")
+
+
+async def wait_until_ns(time_ns: float) -> None:
+    """Wait until absolute simulation time ``time_ns``; return at once if it has passed."""
+    remaining = get_sim_steps(time_ns, "ns", round_mode="round") - get_sim_time("step")
+    if remaining > 0:
+        await Timer(remaining, unit="step")
+
+
+class _TimeBuffer:
+    """Append-only float64 buffer that grows by doubling."""
+
+    def __init__(self, capacity: int) -> None:
+        self._data = np.empty(max(1, capacity), dtype=np.float64)
+        self._size = 0
+
+    def append(self, value: float) -> None:
+        if self._size == self._data.size:
+            self._data = np.resize(self._data, 2 * self._data.size)
+        self._data[self._size] = value
+        self._size += 1
+
+    def view(self) -> np.ndarray:
+        return self._data[: self._size]
+
+
+class BeatTimestampRecorder:
+    """Record when beats are accepted (VALID && READY) and stalled (VALID && !READY).
+
+    Handshake signals are sampled at each rising edge, i.e. the values the edge
+    transfers, the same way cocotbext-axi does. Times are in ns.
+    """
+
+    def __init__(self, dut, i_clk, prefix: str, capacity: int = 1 << 16) -> None:
+        self.i_clk = i_clk
+        self.tvalid = getattr(dut, f"{prefix}_tvalid")
+        self.tready = getattr(dut, f"{prefix}_tready")
+        self._accepted = _TimeBuffer(capacity)
+        self._stalled = _TimeBuffer(capacity // 4)
+        self.clock_period_ns: float | None = None
+        self._task = None
+
+    @property
+    def accepted_ns(self) -> np.ndarray:
+        """Times of accepted beats, in acceptance order."""
+        return self._accepted.view()
+
+    @property
+    def stalled_ns(self) -> np.ndarray:
+        """Times of cycles with ``VALID=1, READY=0``."""
+        return self._stalled.view()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = cocotb.start_soon(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        clock_edge = RisingEdge(self.i_clk)
+        previous_edge_ns = None
+        accepted = self._accepted
+        stalled = self._stalled
+
+        while True:
+            await clock_edge
+            now_ns = get_sim_time("ns")
+            if self.clock_period_ns is None:
+                if previous_edge_ns is not None:
+                    self.clock_period_ns = now_ns - previous_edge_ns
+                previous_edge_ns = now_ns
+
+            tvalid = self.tvalid.value
+            if not tvalid.is_resolvable or int(tvalid) != 1:
+                continue
+            tready = self.tready.value
+            if tready.is_resolvable and int(tready) == 1:
+                accepted.append(now_ns)
+            else:
+                stalled.append(now_ns)
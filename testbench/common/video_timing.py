@@ -0,0 +1,118 @@
+"""Video timing model: active size, blanking and pixel clock of camera/HDMI streams."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class VideoTiming:
+    """Raster timing of a video mode, in pixel-clock periods.
+
+    One line takes ``width + hblank`` pixel clocks and one frame ``height + vblank``
+    lines. The AXI side runs at the DUT clock, so these numbers only pace when lines
+    may start (source) and by when they must be drained (sink).
+    """
+
+    name: str
+    width: int
+    height: int
+    hblank: int
+    vblank: int
+    pixel_clock_hz: float
+
+    def __post_init__(self) -> None:
+        if self.width <= 0 or self.height <= 0:
+            raise ValueError(f"{self.name}: active size must be positive.")
+        if self.hblank < 0 or self.vblank < 0:
+            raise ValueError(f"{self.name}: blanking must be non-negative.")
+        if self.pixel_clock_hz <= 0:
+            raise ValueError(f"{self.name}: pixel clock must be positive.")
+
+    @property
+    def h_total(self) -> int:
+        return self.width + self.hblank
+
+    @property
+    def v_total(self) -> int:
+        return self.height + self.vblank
+
+    @property
+    def pixel_period_ns(self) -> float:
+        return 1e9 / self.pixel_clock_hz
+
+    @property
+    def line_period_ns(self) -> float:
+        return self.h_total * self.pixel_period_ns
+
+    @property
+    def frame_period_ns(self) -> float:
+        return self.v_total * self.line_period_ns
+
+    @property
+    def frame_rate_hz(self) -> float:
+        return 1e9 / self.frame_period_ns
+
+    def line_start_ns(self, frame: int, y: int) -> float:
+        """Start of active line ``y`` of frame ``frame``, relative to frame 0 line 0."""
+        return (frame * self.v_total + y) * self.line_period_ns
+
+    def check_geometry(self, width: int, height: int) -> None:
+        if (width, height) != (self.width, self.height):
+            raise ValueError(
+                f"Frame is {width}x{height}, but timing {self.name} expects "
+                f"{self.width}x{self.height}.",
+            )
+
+
+# CEA-861 timings (active + blanking in pixels/lines).
+VIDEO_TIMINGS: dict[str, VideoTiming] = {
+    timing.name: timing
+    for timing in (
+        VideoTiming("720p60", 1280, 720, hblank=370, vblank=30, pixel_clock_hz=74.25e6),
+        VideoTiming("1080p30", 1920, 1080, hblank=280, vblank=45, pixel_clock_hz=74.25e6),
+        VideoTiming("1080p60", 1920, 1080, hblank=280, vblank=45, pixel_clock_hz=148.5e6),
+    )
+}
+
+
+@dataclass(slots=True)
+class VideoTimingStats:
+    """Per-line real-time budget usage collected by timed sources and sinks.
+
+    A line's busy time runs from its scheduled start to the moment it was fully
+    transferred; its slack is the line period minus that. Negative slack means the
+    DUT could not keep up with the video timing.
+    """
+
+    line_period_ns: float
+    lines: int = 0
+    late_lines: int = 0
+    min_slack_ns: float = math.inf
+    worst_line: tuple[int, int] | None = None
+    """``(frame, y)`` of the line with the least slack."""
+
+    def record(self, frame: int, y: int, busy_ns: float) -> None:
+        slack_ns = self.line_period_ns - busy_ns
+        self.lines += 1
+        if slack_ns < 0:
+            self.late_lines += 1
+        if slack_ns < self.min_slack_ns:
+            self.min_slack_ns = slack_ns
+            self.worst_line = (frame, y)
+
+    @property
+    def min_slack_fraction(self) -> float:
+        """Least slack as a fraction of the line period (1.0 = idle, < 0 = too slow)."""
+        return self.min_slack_ns / self.line_period_ns
+
+    def summary(self) -> str:
+        return (
+            f"{self.lines} lines, {self.late_lines} late, min slack {self.min_slack_ns:.1f} ns "
+            f"({self.min_slack_fraction:.1%} of {self.line_period_ns:.1f} ns) "
+            f"at frame/line {self.worst_line}"
+        )
+
+    def assert_real_time(self, what: str) -> None:
+        assert self.late_lines == 0, f"{what} missed the video timing: {self.summary()}"
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator
 
+from cocotb.utils import get_sim_time
 from cocotbext.axi import (  # type: ignore[missing-imports]
     AxiStreamBus,
     AxiStreamFrame,
     AxiStreamSource,
 )
+from common.packing import line_frames, pixels_per_clock
+from common.timing import BeatTimestampRecorder, wait_until_ns
+from common.video_timing import VideoTiming, VideoTimingStats
 from models.image_model import Image
 
 
@@ -19,7 +24,12 @@ class _KnownIdleAxiStreamSource(AxiStreamSource):
 
 
 class AxiVideoStreamSource:
-    """Drive AXI4-Stream video frames with SOF on TUSER and EOL on TLAST."""
+    """Drive AXI4-Stream video frames with SOF on TUSER and EOL on TLAST.
+
+    The pixels per clock follow from the TDATA width (24, 48 or 96 bits for 1, 2 or
+    4 PPC; see ``common.packing``). Lines that do not fill their last beat need a
+    TKEEP port, which cocotbext-axi drives for the partial beat.
+    """
 
     def __init__(
         self,
@@ -28,6 +38,7 @@ class AxiVideoStreamSource:
         i_rst_n,
         prefix: str = "s_axis_video",
         reset_active_level: bool = True,
+        record_timestamps: bool = False,
     ) -> None:
         bus = AxiStreamBus.from_prefix(dut, prefix)
         self._source = _KnownIdleAxiStreamSource(
@@ -38,13 +49,30 @@ class AxiVideoStreamSource:
         )
         self._byte_lanes = int(self._source.byte_lanes)
         self._byte_size = int(self._source.byte_size)
+        if self._byte_size != 8:
+            raise AssertionError(
+                "AxiVideoStreamSource currently requires an 8-bit AXI byte size; "
+                f"got byte_size={self._byte_size}.",
+            )
+        self._has_tkeep = hasattr(self._source.bus, "tkeep")
+        self.pixels_per_clock = pixels_per_clock(self._byte_lanes)
         self._source.log.setLevel(logging.WARNING)
         self._drive_idle_known()
 
+        # Optional per-beat acceptance times for throughput/latency metrics.
+        self.timestamps: BeatTimestampRecorder | None = None
+        if record_timestamps:
+            self.timestamps = BeatTimestampRecorder(dut, i_clk, prefix)
+            self.timestamps.start()
+
     def set_pause_generator(self, generator=None) -> None:
         """Apply optional TVALID throttling pattern."""
         self._source.set_pause_generator(generator)
 
+    def set_pause(self, paused: bool) -> None:
+        """Directly control source pause (`True` holds TVALID low between beats)."""
+        self._source.pause = bool(paused)
+
     def _drive_idle_known(self) -> None:
         """Force deterministic idle values on source sideband/data outputs."""
         self._source.bus.tdata.value = 0
@@ -53,58 +81,69 @@ class AxiVideoStreamSource:
         if hasattr(self._source.bus, "tuser"):
             self._source.bus.tuser.value = 0
 
-    def _validate_line_geometry(
-        self,
-        line_bytes_len: int,
-        *,
-        image_width: int,
-        line_index: int,
-    ) -> None:
-        if self._byte_size != 8:
-            raise AssertionError(
-                "AxiVideoStreamSource currently requires an 8-bit AXI byte size; "
-                f"got byte_size={self._byte_size}.",
-            )
+    def _line_frames(self, image: Image) -> Iterator[AxiStreamFrame]:
+        """Pack one image into AXI packets, one per line, in transmit order."""
+        return line_frames(image, self._byte_lanes, has_tkeep=self._has_tkeep)
 
-        if self._byte_lanes <= 0:
-            raise AssertionError(
-                f"AxiVideoStreamSource detected invalid AXI byte lane count: {self._byte_lanes}.",
-            )
-
-        if line_bytes_len % self._byte_lanes != 0:
-            raise AssertionError(
-                "AXI4-Stream line byte count must align to beat size when tkeep is not modeled: "
-                f"line={line_index}, width={image_width}, line_bytes={line_bytes_len}, "
-                f"byte_lanes={self._byte_lanes}.",
-            )
-
-    def _build_line_tuser(self, line_bytes_len: int, *, line_index: int) -> list[int]:
-        """Build TUSER=SOF pattern for the first pixel of the frame."""
-        if line_index != 0 or line_bytes_len == 0:
-            return [0] * line_bytes_len
-
-        # Mark all bytes of beat 0 as SOF to avoid byte-index ambiguity in sideband packing.
-        first_beat_len = min(self._byte_lanes, line_bytes_len)
-        return [1] * first_beat_len + [0] * (line_bytes_len - first_beat_len)
+    async def _queue_image(self, image: Image) -> None:
+        """Queue all lines of one image without waiting for them to be transmitted."""
+        for frame in self._line_frames(image):
+            await self._source.send(frame)
 
     async def send_image(self, image: Image) -> None:
         """Send one image as AXI4-Video: one AXI packet per line."""
-        for y in range(image.height):
-            line_bytes = bytearray()
-
-            for x in range(image.width):
-                r, g, b = (int(v) & 0xFF for v in image.pixels[y, x])
-                # cocotbext-axi packs lane 0 into TDATA[7:0], lane 1 into [15:8], lane 2 into [23:16].
-                line_bytes.extend((b, g, r))
-
-            self._validate_line_geometry(
-                line_bytes_len=len(line_bytes),
-                image_width=image.width,
-                line_index=y,
-            )
-            tuser = self._build_line_tuser(len(line_bytes), line_index=y)
+        await self.send_images((image,))
 
-            await self._source.send(AxiStreamFrame(tdata=line_bytes, tuser=tuser))
+    async def send_images(
+        self,
+        images: Iterable[Image],
+        *,
+        max_queued_lines: int | None = None,
+    ) -> None:
+        """Send frames back to back, keeping the source queue fed across frame boundaries.
+
+        ``max_queued_lines`` bounds the source queue so a lazily generated sequence is
+        only pulled as fast as the DUT consumes it (constant memory for soak runs).
+        """
+        if max_queued_lines is not None:
+            self._source.queue_occupancy_limit_frames = max_queued_lines
+        try:
+            for image in images:
+                await self._queue_image(image)
+
+            await self._source.wait()
+        finally:
+            self._source.queue_occupancy_limit_frames = -1
+        self._drive_idle_known()
+
+    async def send_images_timed(
+        self,
+        images: Iterable[Image],
+        timing: VideoTiming,
+        *,
+        start_ns: float | None = None,
+        stats: VideoTimingStats | None = None,
+    ) -> VideoTimingStats:
+        """Send frames paced like a camera: lines only start at their raster time.
+
+        Line ``y`` of frame ``k`` is released at ``start_ns + timing.line_start_ns(k, y)``
+        (default start: now), leaving horizontal and vertical blanking as idle bus
+        time. Within a line, beats go out at bus rate as far as TREADY allows. Each
+        line's transfer time is recorded in ``stats``; a line that is still being
+        sent when the next one is due counts as late (a real sensor would overflow).
+        """
+        stats = stats if stats is not None else VideoTimingStats(timing.line_period_ns)
+        if start_ns is None:
+            start_ns = get_sim_time("ns")
+
+        for frame_index, image in enumerate(images):
+            timing.check_geometry(image.width, image.height)
+            for y, frame in enumerate(self._line_frames(image)):
+                release_ns = start_ns + timing.line_start_ns(frame_index, y)
+                await wait_until_ns(release_ns)
+                await self._source.send(frame)
+                await self._source.wait()
+                stats.record(frame_index, y, get_sim_time("ns") - release_ns)
 
-        await self._source.wait()
         self._drive_idle_known()
+        return stats
@@ -0,0 +1,143 @@
+"""Model cache layer: persistent on-disk cache for decoded images and golden outputs.
+
+Entries are raw ``.npy`` arrays under ``sim_build/frame_cache`` that are memory-mapped
+back on a hit, so neither PNG decoding nor golden-model evaluation is repeated across
+tests, shards and targets. The cache is shared between processes: entries are written
+atomically and eviction is least-recently-used by file modification time.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+from models import golden_model
+from models.golden_model import Stage
+from models.image_model import Image
+
+TESTBENCH_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = TESTBENCH_ROOT / "sim_build" / "frame_cache"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+CACHE_DIR_ENV = "TB_FRAME_CACHE_DIR"
+CACHE_MAX_MB_ENV = "TB_FRAME_CACHE_MAX_MB"
+
+
+@functools.cache
+def _golden_model_digest() -> str:
+    """Digest of the golden-model source so model edits invalidate cached outputs."""
+    return hashlib.blake2b(Path(golden_model.__file__).read_bytes(), digest_size=8).hexdigest()
+
+
+def _array_digest(array: np.ndarray) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+    digest.update(np.ascontiguousarray(array).data)
+    return digest.hexdigest()
+
+
+class FrameCache:
+    """Size-bounded LRU cache of ``uint8`` frames stored as memory-mappable ``.npy`` files."""
+
+    def __init__(
+        self,
+        root: str | Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        min_entry_bytes: int = 256 * 1024,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        # Below this size recomputing is cheaper than hashing plus file I/O.
+        self.min_entry_bytes = int(min_entry_bytes)
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.npy"
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Return a read-only memory map of entry ``key``, or ``None`` on a miss."""
+        path = self._path(key)
+        try:
+            array = np.load(path, mmap_mode="r")
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        # Refresh the LRU timestamp; a concurrent eviction may have removed the file.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return array
+
+    def put(self, key: str, array: np.ndarray) -> np.ndarray:
+        """Store ``array`` atomically under ``key`` and evict old entries if over budget."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".npy.tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                np.save(tmp_file, np.ascontiguousarray(array))
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self.evict()
+        return array
+
+    def get_or_compute(self, key: str, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        return self.put(key, compute())
+
+    def evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        for path in self.root.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def load_png(self, path: str | Path) -> Image:
+        """Decode ``path`` once; later calls map the cached pixels without decoding."""
+        file_digest = hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+        pixels = self.get_or_compute(
+            f"png-{file_digest}",
+            lambda: Image.from_png(path).pixels,
+        )
+        return Image.wrap(pixels).validate()
+
+    def expected(self, pipeline: Stage, image: Image) -> Image:
+        """Return the golden-model output of ``pipeline`` for ``image``.
+
+        The key combines the input pixel hash, the pipeline parameters (its ``repr``)
+        and the golden-model source digest.
+        """
+        apply = getattr(pipeline, "apply", None)
+        if not callable(apply):
+            apply = golden_model.Pipeline((pipeline,)).apply
+        if image.pixels.nbytes < self.min_entry_bytes:
+            return apply(image)
+
+        params = hashlib.blake2b(repr(pipeline).encode(), digest_size=8).hexdigest()
+        key = f"golden-{_array_digest(image.pixels)}-{params}-{_golden_model_digest()}"
+        return Image.wrap(self.get_or_compute(key, lambda: apply(image).pixels)).validate()
+
+
+@functools.cache
+def default_frame_cache() -> FrameCache:
+    """Process-wide cache configured by ``TB_FRAME_CACHE_DIR`` / ``TB_FRAME_CACHE_MAX_MB``."""
+    root = os.getenv(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+    max_mb = os.getenv(CACHE_MAX_MB_ENV)
+    max_bytes = int(max_mb) * 1024**2 if max_mb else DEFAULT_MAX_BYTES
+    return FrameCache(root=root, max_bytes=max_bytes)
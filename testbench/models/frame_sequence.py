@@ -0,0 +1,243 @@
+"""Model sequence layer: lazily decoded multi-frame inputs with background prefetch.
+
+A ``FrameSequence`` knows its geometry and length up front, but decodes frames only
+while it is iterated. ``prefetched()`` moves that decoding to a background thread
+with a bounded queue, so decoding frame N+1 overlaps with simulating frame N and at
+most ``depth`` decoded frames are ever waiting, however long the clip is.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+
+import numpy as np
+from models.image_model import Image
+from PIL import Image as PILImage
+
+DEFAULT_PREFETCH_DEPTH = 4
+
+
+class _End:
+    """Queue marker: the producer is exhausted."""
+
+
+class _Failure:
+    """Queue marker carrying an exception raised while decoding."""
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+def prefetch(frames: Iterable[Image], depth: int = DEFAULT_PREFETCH_DEPTH) -> Iterator[Image]:
+    """Iterate ``frames`` on a background thread, keeping at most ``depth`` frames ahead.
+
+    Decoding errors are re-raised in the consuming thread. Closing the returned
+    generator early (``break``, exception, task cancel) stops and joins the thread.
+    """
+    if depth < 1:
+        raise ValueError(f"Prefetch depth must be >= 1, got {depth}.")
+
+    buffer: queue.Queue[Image | _End | _Failure] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item: Image | _End | _Failure) -> bool:
+        # Poll the stop flag so an abandoned consumer never leaves the thread blocked.
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for image in frames:
+                if not put(image):
+                    return
+        except BaseException as exc:
+            # Re-raised by the consumer, which is where the test can report it.
+            put(_Failure(exc))
+            return
+        put(_End())
+
+    thread = threading.Thread(target=produce, name="frame-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if isinstance(item, _End):
+                return
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+class FrameSequence(ABC):
+    """Base class: a fixed-geometry clip whose frames are decoded on demand."""
+
+    width: int
+    height: int
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def frame(self, index: int) -> Image:
+        """Decode frame ``index`` into a fresh ``(H, W, 3)`` uint8 buffer."""
+
+    def __iter__(self) -> Iterator[Image]:
+        for index in range(len(self)):
+            yield self.frame(index)
+
+    def prefetched(self, depth: int = DEFAULT_PREFETCH_DEPTH) -> Iterator[Image]:
+        """Iterate with decoding on a background thread (see ``prefetch``)."""
+        return prefetch(self, depth=depth)
+
+    def _check_geometry(self, image: Image, source: object) -> Image:
+        if (image.width, image.height) != (self.width, self.height):
+            raise ValueError(
+                f"Frame {source} is {image.width}x{image.height}, "
+                f"sequence is {self.width}x{self.height}",
+            )
+        return image
+
+
+class PngDirectorySequence(FrameSequence):
+    """PNG files of a directory in file-name order."""
+
+    def __init__(self, directory: str | Path, pattern: str = "*.png") -> None:
+        self.paths: Sequence[Path] = sorted(Path(directory).glob(pattern))
+        if not self.paths:
+            raise FileNotFoundError(f"No files matching {pattern!r} in {directory}")
+        # Only the header is read here; pixel data is decoded per frame.
+        with PILImage.open(self.paths[0]) as first:
+            self.width, self.height = first.size
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def frame(self, index: int) -> Image:
+        path = self.paths[index]
+        return self._check_geometry(Image.from_png(path), path)
+
+
+class NumpySequence(FrameSequence):
+    """Frames from ``.npy`` (an ``(N, H, W, 3)`` stack) or ``.npz`` files.
+
+    A ``.npy`` stack is memory-mapped, so only the frames being read are paged in.
+    An ``.npz`` holds either one such stack (``key`` selects it when there are
+    several arrays) or one ``(H, W, 3)`` array per frame in sorted key order; the
+    latter is read member by member. A single ``.npz`` stack is decompressed as a
+    whole by NumPy, so prefer ``.npy`` or per-frame members for long clips.
+    The archive is only open while frames are being read.
+    """
+
+    def __init__(self, path: str | Path, key: str | None = None) -> None:
+        self.path = Path(path)
+        self._stack: np.ndarray | None = None
+        self._keys: list[str] = []
+        first: Image | None = None
+
+        if self.path.suffix == ".npy":
+            self._stack = np.load(self.path, mmap_mode="r")
+        elif self.path.suffix == ".npz":
+            with np.load(self.path) as archive:
+                keys = sorted(archive.files)
+                if key is not None or len(keys) == 1:
+                    self._stack = archive[key if key is not None else keys[0]]
+                else:
+                    self._keys = keys
+                    first = Image(pixels=archive[keys[0]])
+        else:
+            raise ValueError(f"Expected a .npy or .npz file, got {self.path}")
+
+        if self._stack is not None:
+            if self._stack.ndim != 4 or self._stack.shape[3] != 3:
+                raise ValueError(
+                    f"Expected an (N, H, W, 3) frame stack, got shape={self._stack.shape}",
+                )
+            _, self.height, self.width, _ = self._stack.shape
+        else:
+            assert first is not None
+            self.height, self.width = first.height, first.width
+
+    def __len__(self) -> int:
+        return len(self._stack) if self._stack is not None else len(self._keys)
+
+    def frame(self, index: int) -> Image:
+        if self._stack is not None:
+            # Copy out of the mapping so the frame is decoded (paged in) right here.
+            return Image(pixels=np.array(self._stack[index]))
+        key = self._keys[index]
+        with np.load(self.path) as archive:
+            return self._check_geometry(Image(pixels=archive[key]), key)
+
+    def __iter__(self) -> Iterator[Image]:
+        if self._stack is not None:
+            yield from super().__iter__()
+            return
+        # One open archive for the whole pass; closed when iteration ends or is abandoned.
+        with np.load(self.path) as archive:
+            for key in self._keys:
+                yield self._check_geometry(Image(pixels=archive[key]), key)
+
+
+class RawRgb24Sequence(FrameSequence):
+    """Headerless RGB24 video (``R, G, B`` bytes per pixel, frames back to back).
+
+    This is what ``ffmpeg -f rawvideo -pix_fmt rgb24`` writes; the geometry has to
+    be given because the file carries none. A trailing partial frame is an error.
+    """
+
+    def __init__(self, path: str | Path, width: int, height: int) -> None:
+        self.path = Path(path)
+        self.width = width
+        self.height = height
+        frame_bytes = width * height * 3
+        size = self.path.stat().st_size
+        if frame_bytes <= 0 or size == 0 or size % frame_bytes:
+            raise ValueError(
+                f"{self.path} ({size} bytes) is not a whole number of {width}x{height} "
+                "RGB24 frames",
+            )
+        self._frames = np.memmap(self.path, dtype=np.uint8, mode="r").reshape(
+            -1,
+            height,
+            width,
+            3,
+        )
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def frame(self, index: int) -> Image:
+        return Image.wrap(np.array(self._frames[index]))
+
+
+def open_sequence(
+    path: str | Path,
+    *,
+    width: int | None = None,
+    height: int | None = None,
+    key: str | None = None,
+) -> FrameSequence:
+    """Open a PNG directory, ``.npy``/``.npz`` stack or raw RGB24 file by its path.
+
+    Raw files (any other suffix) need ``width`` and ``height``.
+    """
+    path = Path(path)
+    if path.is_dir():
+        return PngDirectorySequence(path)
+    if path.suffix in (".npy", ".npz"):
+        return NumpySequence(path, key=key)
+    if width is None or height is None:
+        raise ValueError(f"Raw RGB24 input {path} needs width and height.")
+    return RawRgb24Sequence(path, width=width, height=height)
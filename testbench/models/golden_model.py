@@ -0,0 +1,227 @@
+"""Golden-model layer: bit-exact, vectorized reference models of the pipeline stages.
+
+Frames are NumPy arrays. RGB frames have shape ``(..., H, W, 3)`` and mono frames have
+shape ``(..., H, W)``; any leading axes are treated as a batch, so a whole frame
+sequence can be pushed through a pipeline in one call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+from models.image_model import Image
+
+BorderMode = Literal["replicate", "zero", "drop"]
+"""3x3 window border policy (see ``docs/window_gen.md``); ``drop`` shrinks H and W by 2."""
+
+Stage = Callable[[np.ndarray], np.ndarray]
+
+
+def _require_rgb(frame: np.ndarray, stage: str) -> None:
+    if frame.ndim < 3 or frame.shape[-1] != 3:
+        raise ValueError(f"{stage} expects RGB frames (..., H, W, 3), got shape={frame.shape}")
+
+
+def _require_mono(frame: np.ndarray, stage: str) -> None:
+    if frame.ndim < 2:
+        raise ValueError(f"{stage} expects mono frames (..., H, W), got shape={frame.shape}")
+
+
+def _pad_window(frame: np.ndarray, border: BorderMode) -> np.ndarray:
+    """Pad the two spatial axes by one pixel so a 3x3 window covers every pixel."""
+    if border == "drop":
+        if frame.shape[-2] < 3 or frame.shape[-1] < 3:
+            raise ValueError(f"Frame too small for a 3x3 window: shape={frame.shape}")
+        return frame
+
+    pad_width = [(0, 0)] * (frame.ndim - 2) + [(1, 1), (1, 1)]
+    if border == "replicate":
+        return np.pad(frame, pad_width, mode="edge")
+    if border == "zero":
+        return np.pad(frame, pad_width, mode="constant")
+    raise ValueError(f"Unknown border mode: {border!r}")
+
+
+def _taps(frame: np.ndarray, axis: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the three aligned 3-tap views (before, center, after) along ``axis``."""
+    length = frame.shape[axis] - 2
+    views = []
+    for start in range(3):
+        index = [slice(None)] * frame.ndim
+        index[axis] = slice(start, start + length)
+        views.append(frame[tuple(index)])
+    return views[0], views[1], views[2]
+
+
+def sobel_gradients(
+    frame: np.ndarray,
+    border: BorderMode = "replicate",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute signed Sobel ``Gx``/``Gy`` (int16, range [-1020, 1020]) of a mono frame.
+
+    ``Gx = [[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]]`` (positive for rising intensity to the
+    right) and ``Gy`` is its transpose (positive for rising intensity downwards). Both
+    are evaluated as separable ``[1, 2, 1]`` smoothing plus ``[-1, 0, 1]`` difference.
+    """
+    _require_mono(frame, "sobel_gradients")
+    padded = _pad_window(frame.astype(np.int16), border)
+
+    top, middle, bottom = _taps(padded, axis=-2)
+    left, _, right = _taps(top + 2 * middle + bottom, axis=-1)
+    gx = right - left
+
+    left, center, right = _taps(padded, axis=-1)
+    top, _, bottom = _taps(left + 2 * center + right, axis=-2)
+    gy = bottom - top
+
+    return gx, gy
+
+
+@dataclass(frozen=True, slots=True)
+class Grayscale:
+    """RGB -> Y as ``(R >> 2) + (G >> 1) + (B >> 2)``, matching ``RgbToGrayscale.vhd``."""
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        _require_rgb(frame, "Grayscale")
+        rgb = frame.astype(np.uint8, copy=False)
+        # 63 + 127 + 63 = 253, so the sum cannot overflow uint8.
+        return (rgb[..., 0] >> 2) + (rgb[..., 1] >> 1) + (rgb[..., 2] >> 2)
+
+
+@dataclass(frozen=True, slots=True)
+class GrayToRgb:
+    """Replicate Y into R=G=B (the ``G_OUTPUT_WIDTH = 3 * G_COMPONENT_WIDTH`` format)."""
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        _require_mono(frame, "GrayToRgb")
+        mono = frame.astype(np.uint8, copy=False)
+        return np.repeat(mono[..., np.newaxis], 3, axis=-1)
+
+
+@dataclass(frozen=True, slots=True)
+class BoxBlur3x3:
+    """3x3 average low-pass filter with a fixed-point reciprocal of 9.
+
+    ``out = (sum3x3 * reciprocal) >> shift``. The default ``7282 / 2**16`` equals
+    ``floor(sum / 9)`` for every possible 3x3 sum of 8-bit pixels (0..2295).
+    """
+
+    border: BorderMode = "replicate"
+    reciprocal: int = 7282
+    shift: int = 16
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        _require_mono(frame, "BoxBlur3x3")
+        padded = _pad_window(frame.astype(np.uint32), self.border)
+
+        top, middle, bottom = _taps(padded, axis=-2)
+        left, center, right = _taps(top + middle + bottom, axis=-1)
+        window_sum = left + center + right
+
+        blurred = (window_sum * np.uint32(self.reciprocal)) >> np.uint32(self.shift)
+        return np.minimum(blurred, 255).astype(np.uint8)
+
+
+@dataclass(frozen=True, slots=True)
+class SobelGradient:
+    """Signed Sobel gradient along one axis (int16); see ``sobel_gradients``."""
+
+    axis: Literal["x", "y"] = "x"
+    border: BorderMode = "replicate"
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        if self.axis not in ("x", "y"):
+            raise ValueError(f"Sobel axis must be 'x' or 'y', got {self.axis!r}")
+        gx, gy = sobel_gradients(frame, border=self.border)
+        return gx if self.axis == "x" else gy
+
+
+@dataclass(frozen=True, slots=True)
+class SobelMagnitude:
+    """L1 gradient magnitude ``(|Gx| + |Gy|) >> shift``, saturated to 8 bits."""
+
+    border: BorderMode = "replicate"
+    shift: int = 0
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        gx, gy = sobel_gradients(frame, border=self.border)
+        magnitude = (np.abs(gx) + np.abs(gy)) >> self.shift
+        return np.minimum(magnitude, 255).astype(np.uint8)
+
+
+@dataclass(frozen=True, slots=True)
+class Threshold:
+    """Binarize a mono frame: ``high`` where ``value >= level``, else ``low``."""
+
+    level: int
+    high: int = 255
+    low: int = 0
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        _require_mono(frame, "Threshold")
+        return np.where(frame >= self.level, self.high, self.low).astype(np.uint8)
+
+
+@dataclass(frozen=True, slots=True)
+class Overlay:
+    """Paint ``color`` onto the RGB input wherever ``mask(input)`` is non-zero.
+
+    ``mask`` is any stage or pipeline mapping the RGB frame to a same-sized mono frame,
+    e.g. ``Pipeline((Grayscale(), SobelMagnitude(), Threshold(64)))``.
+    """
+
+    mask: Stage
+    color: tuple[int, int, int] = (255, 0, 0)
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        _require_rgb(frame, "Overlay")
+        mask = self.mask(frame)
+        if mask.shape != frame.shape[:-1]:
+            raise ValueError(
+                "Overlay mask must match the frame geometry (use a non-'drop' border): "
+                f"mask={mask.shape}, frame={frame.shape}",
+            )
+        color = np.asarray(self.color, dtype=np.uint8)
+        return np.where(mask[..., np.newaxis] != 0, color, frame).astype(np.uint8)
+
+
+@dataclass(frozen=True, slots=True)
+class Pipeline:
+    """Ordered composition of stages; itself a stage, so pipelines nest."""
+
+    stages: tuple[Stage, ...] = ()
+
+    def then(self, *stages: Stage) -> Pipeline:
+        """Return a new pipeline with ``stages`` appended."""
+        return Pipeline(self.stages + stages)
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        for stage in self.stages:
+            frame = stage(frame)
+        return frame
+
+    def apply(self, image: Image) -> Image:
+        """Run the pipeline on one image; mono results are replicated to GrayRGB."""
+        return Image(self._to_rgb(self(image.pixels), rgb_ndim=3))
+
+    def apply_sequence(self, images: Iterable[Image]) -> list[Image]:
+        """Run the pipeline once over a stacked sequence of equally sized images."""
+        frames = [image.pixels for image in images]
+        if not frames:
+            return []
+        outputs = self._to_rgb(self(np.stack(frames)), rgb_ndim=4)
+        return [Image(output) for output in outputs]
+
+    @staticmethod
+    def _to_rgb(frame: np.ndarray, *, rgb_ndim: int) -> np.ndarray:
+        # A stage that dropped the channel axis produced mono output.
+        if frame.ndim == rgb_ndim:
+            return frame
+        return GrayToRgb()(frame)
+
+
+GRAYSCALE_RGB = Pipeline((Grayscale(), GrayToRgb()))
+"""Reference for ``AxiRgbToGrayscale`` with the default 24-bit GrayRGB output."""
@@ -37,12 +37,38 @@ class Image:
                 )
 
     @classmethod
-    def gradient(cls, width: int, height: int) -> Image:
-        """Generate a deterministic RGB gradient-style test frame."""
-        y, x = np.indices((height, width), dtype=np.uint16)
-        r = (x * 7 + y * 3) % 256
-        g = (x * 5 + y * 11) % 256
-        b = (x * 13 + y * 2) % 256
+    def wrap(cls, pixels: np.ndarray) -> Image:
+        """Wrap a trusted ``(H, W, 3)`` uint8 array without copying or scanning it.
+
+        Intended for buffers the testbench produced itself (sink frame buffers, memory
+        maps, views). Call ``validate()`` to opt into checking the wrapped array.
+        """
+        image = cls.__new__(cls)
+        image.pixels = pixels
+        return image
+
+    def validate(self) -> Image:
+        """Check shape and dtype of a wrapped image; returns ``self`` for chaining."""
+        if not isinstance(self.pixels, np.ndarray):
+            raise ValueError(f"Expected a NumPy array, got {type(self.pixels).__name__}")
+        if self.pixels.ndim != 3 or self.pixels.shape[2] != 3:
+            raise ValueError(
+                f"Expected RGB image array with shape (H, W, 3), got shape={self.pixels.shape}",
+            )
+        if self.pixels.dtype != np.uint8:
+            raise ValueError(f"Expected uint8 image dtype, got {self.pixels.dtype}")
+        return self
+
+    @classmethod
+    def gradient(cls, width: int, height: int, phase: int = 0) -> Image:
+        """Generate a deterministic RGB gradient-style test frame.
+
+        A non-zero ``phase`` shifts every channel so consecutive frames of a sequence differ.
+        """
+        y, x = np.indices((height, width), dtype=np.uint32)
+        r = (x * 7 + y * 3 + phase) % 256
+        g = (x * 5 + y * 11 + 2 * phase) % 256
+        b = (x * 13 + y * 2 + 3 * phase) % 256
         pixels = np.stack([r, g, b], axis=2).astype(np.uint8)
         return cls(pixels=pixels)
 
@@ -64,6 +90,22 @@ class Image:
     def channels(self) -> int:
         return int(self.pixels.shape[2])
 
+    def rows(self, start: int, stop: int) -> Image:
+        """Return lines ``[start, stop)`` as an ``Image`` view sharing this buffer."""
+        if not 0 <= start <= stop <= self.height:
+            raise IndexError(f"Row range out of bounds: [{start}, {stop}) for height={self.height}")
+        return Image.wrap(self.pixels[start:stop])
+
+    def crop(self, x: int, y: int, width: int, height: int) -> Image:
+        """Return a ``width`` x ``height`` window at ``(x, y)`` as an ``Image`` view."""
+        if x < 0 or y < 0 or width < 0 or height < 0:
+            raise IndexError(f"Invalid crop: x={x}, y={y}, width={width}, height={height}")
+        if x + width > self.width or y + height > self.height:
+            raise IndexError(
+                f"Crop ({x}, {y}, {width}x{height}) exceeds image {self.width}x{self.height}",
+            )
+        return Image.wrap(self.pixels[y : y + height, x : x + width])
+
     def flat_pixels(self) -> np.ndarray:
         return self.pixels.reshape(-1, 3)
 
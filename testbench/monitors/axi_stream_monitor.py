@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import numpy as np
 from cocotb.queue import Queue
-from cocotb.triggers import RisingEdge, SimTimeoutError, with_timeout
+from cocotb.triggers import First, RisingEdge, SimTimeoutError, ValueChange, with_timeout
 
+from common.timing import log_frame_pixels
 from models.image_model import Image
 
 
@@ -26,38 +27,49 @@ class AxiStreamMonitor:
         self._frames: Queue[Image] = Queue()
 
     @staticmethod
-    def _unpack_rgb(word: int) -> tuple[int, int, int]:
-        r = (word >> 16) & 0xFF
-        g = (word >> 8) & 0xFF
-        b = word & 0xFF
-        return (r, g, b)
+    def _unpack_rgb(words: np.ndarray) -> np.ndarray:
+        """Unpack packed ``R:G:B`` words (R in TDATA[23:16]) into a trailing RGB axis."""
+        shifts = np.array((16, 8, 0), dtype=np.uint32)
+        return ((words[..., np.newaxis] >> shifts) & 0xFF).astype(np.uint8)
 
     async def run(self) -> None:
+        # Accepted TDATA words land in one reused buffer; channels are split once per frame.
+        frame_words = np.empty(self.width * self.height, dtype=np.uint32)
         in_frame = False
-        pixels: list[tuple[int, int, int]] = []
+        pixel_count = 0
         line_pixels = 0
 
+        clock_edge = RisingEdge(self.i_clk)
+        # While TVALID is low there is nothing to sample, so sleep until it rises
+        # (or reset toggles) instead of waking up on every clock edge.
+        idle_wake = First(RisingEdge(self.tvalid), ValueChange(self.i_rst_n))
+
         while True:
-            await RisingEdge(self.i_clk)
+            await clock_edge
 
             if int(self.i_rst_n.value) == 1:
                 in_frame = False
-                pixels = []
+                pixel_count = 0
                 line_pixels = 0
                 continue
 
-            if int(self.tvalid.value) != 1 or int(self.tready.value) != 1:
+            if int(self.tvalid.value) != 1:
+                await idle_wake
+                continue
+
+            if int(self.tready.value) != 1:
                 continue
 
             if int(self.tuser.value) == 1:
                 in_frame = True
-                pixels = []
+                pixel_count = 0
                 line_pixels = 0
 
             if not in_frame:
                 continue
 
-            pixels.append(self._unpack_rgb(int(self.tdata.value)))
+            frame_words[pixel_count] = int(self.tdata.value) & 0xFFFFFF
+            pixel_count += 1
             line_pixels += 1
 
             if int(self.tlast.value) == 1:
@@ -67,10 +79,12 @@ class AxiStreamMonitor:
                     )
                 line_pixels = 0
 
-            if len(pixels) == self.width * self.height:
-                frame = np.asarray(pixels, dtype=np.uint8).reshape(self.height, self.width, 3)
-                await self._frames.put(Image(frame))
+            if pixel_count == frame_words.size:
+                frame = self._unpack_rgb(frame_words).reshape(self.height, self.width, 3)
+                log_frame_pixels(frame_words.size)
+                await self._frames.put(Image.wrap(frame))
                 in_frame = False
+                pixel_count = 0
 
     async def get_frame(self, timeout_ns: int = 100_000) -> Image:
         try:
@@ -0,0 +1,219 @@
+"""Monitor layer: AXI4-Video output protocol checker (SOF/EOL alignment, stall stability)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+from cocotb.triggers import ReadOnly, RisingEdge
+from common.packing import keep_mask, last_beat_pixels, line_beats
+
+ResolveCheck = Literal["every_cycle", "sampled"]
+"""``every_cycle`` checks all signals for X/U each cycle; ``sampled`` only during the
+first ``resolve_first_cycles`` cycles and in ``VALID=1, READY=0`` stall cycles."""
+
+
+@dataclass(slots=True)
+class HandshakeStats:
+    """Runtime statistics collected by the output protocol checker."""
+
+    saw_stall: bool = False
+    """True once a `VALID=1, READY=0` cycle is observed on the output stream."""
+
+    max_ready_low_run: int = 0
+    """Longest consecutive READY-low run seen during the monitored frame."""
+
+    accepted_beats: int = 0
+    """Count of beats transferred with `VALID && READY` during checking."""
+
+    accepted_pixels: int = 0
+    """Pixels carried by the accepted beats (partial last beats count their valid pixels)."""
+
+    first_accept_cycle: int | None = None
+    """Checker cycle of the first accepted beat (after the last reset)."""
+
+    last_accept_cycle: int | None = None
+    """Checker cycle of the most recent accepted beat."""
+
+    @property
+    def accept_span_cycles(self) -> int:
+        """Clock cycles from the first to the last accepted beat, inclusive."""
+        if self.first_accept_cycle is None or self.last_accept_cycle is None:
+            return 0
+        return self.last_accept_cycle - self.first_accept_cycle + 1
+
+    @property
+    def pixels_per_cycle(self) -> float:
+        """Sustained output pixel rate over the accepted span."""
+        span = self.accept_span_cycles
+        return self.accepted_pixels / span if span else 0.0
+
+
+class AxiStreamProtocolChecker:
+    """Bus-level checker for accepted beats, SOF/EOL placement and stall stability.
+
+    Every signal is read at most once per cycle; the sampled values are reused by all
+    rules. In ``sampled`` mode, payload signals are only converted when a rule needs
+    them, which removes most of the per-cycle Python cost on long frames.
+
+    With ``pixels_per_clock`` > 1 a line spans ``ceil(width / ppc)`` beats. If the
+    stream has a TKEEP port, every accepted beat must keep exactly its valid pixels'
+    lanes (all lanes, except on a partial last beat of a line).
+    """
+
+    def __init__(
+        self,
+        dut,
+        i_clk,
+        i_rst_n,
+        *,
+        width: int,
+        height: int,
+        frames: int = 1,
+        pixels_per_clock: int = 1,
+        prefix: str = "m_axis_video",
+        reset_active_level: bool = True,
+        resolve_check: ResolveCheck = "every_cycle",
+        resolve_first_cycles: int = 64,
+        stats: HandshakeStats | None = None,
+    ) -> None:
+        if resolve_check not in ("every_cycle", "sampled"):
+            raise ValueError(f"Unknown resolve_check mode: {resolve_check!r}")
+
+        self.i_clk = i_clk
+        self.i_rst_n = i_rst_n
+        self.pixels_per_clock = pixels_per_clock
+        self.line_beats = line_beats(width, pixels_per_clock)
+        self.last_beat_pixels = last_beat_pixels(width, pixels_per_clock)
+        self.frame_beats = self.line_beats * height
+        self.expected_beats = self.frame_beats * frames
+        self.reset_active_level = int(reset_active_level)
+        self.resolve_check = resolve_check
+        self.resolve_first_cycles = resolve_first_cycles
+        self.stats = stats if stats is not None else HandshakeStats()
+
+        names = ["tvalid", "tready", "tdata", "tlast", "tuser"]
+        self.has_tkeep = hasattr(dut, f"{prefix}_tkeep")
+        if self.has_tkeep:
+            names.append("tkeep")
+        self._names = tuple(f"{prefix}_{name}" for name in names)
+        self._signals = tuple(getattr(dut, name) for name in self._names)
+
+    def _sample(self, index: int) -> int:
+        value = self._signals[index].value
+        try:
+            return int(value)
+        except ValueError as exc:
+            raise AssertionError(
+                f"{self._names[index]} is not fully resolved at sample point: {value!s}",
+            ) from exc
+
+    def _sample_all(self) -> tuple[int, int, int, int, int]:
+        """Read and resolve TVALID, TREADY, TDATA, TLAST and TUSER once each."""
+        return (
+            self._sample(0),
+            self._sample(1),
+            self._sample(2),
+            self._sample(3),
+            self._sample(4),
+        )
+
+    async def run(self) -> HandshakeStats:
+        stats = self.stats
+        ppc = self.pixels_per_clock
+        beats_per_line = self.line_beats
+        last_pixels = self.last_beat_pixels
+        has_tkeep = self.has_tkeep
+        frame_beats = self.frame_beats
+        full_check = self.resolve_check == "every_cycle"
+        first_cycles = self.resolve_first_cycles
+
+        ready_low_run = 0
+        prev_stall_payload: tuple[int, ...] | None = None
+        accepted_beats = 0
+        accepted_pixels = 0
+        cycle = 0
+        clock_edge = RisingEdge(self.i_clk)
+        read_only = ReadOnly()
+
+        while accepted_beats < self.expected_beats:
+            # Sample in read-only phase so assertions see stable values for this edge.
+            await clock_edge
+            await read_only
+            cycle += 1
+
+            resolved = full_check or cycle <= first_cycles
+            if resolved:
+                valid, ready, tdata, tlast, tuser = self._sample_all()
+            else:
+                valid = self._sample(0)
+                ready = self._sample(1)
+
+            if int(self.i_rst_n.value) == self.reset_active_level:
+                ready_low_run = 0
+                prev_stall_payload = None
+                accepted_beats = 0
+                accepted_pixels = 0
+                stats.first_accept_cycle = None
+                continue
+
+            if ready == 0:
+                ready_low_run += 1
+                if ready_low_run > stats.max_ready_low_run:
+                    stats.max_ready_low_run = ready_low_run
+            else:
+                ready_low_run = 0
+
+            if valid != 1:
+                prev_stall_payload = None
+                continue
+
+            if ready == 1:
+                if not resolved:
+                    tlast = self._sample(3)
+                    tuser = self._sample(4)
+
+                expected_sof = 1 if (accepted_beats % frame_beats) == 0 else 0
+                assert tuser == expected_sof, (
+                    "SOF/TUSER mismatch on accepted output beat "
+                    f"{accepted_beats}: observed={tuser}, expected={expected_sof}"
+                )
+
+                expected_tlast = 1 if ((accepted_beats + 1) % beats_per_line) == 0 else 0
+                assert tlast == expected_tlast, (
+                    "EOL/TLAST mismatch on accepted output beat "
+                    f"{accepted_beats}: observed={tlast}, expected={expected_tlast}"
+                )
+
+                beat_pixels = last_pixels if expected_tlast else ppc
+                if has_tkeep:
+                    tkeep = self._sample(5)
+                    expected_tkeep = keep_mask(beat_pixels)
+                    assert tkeep == expected_tkeep, (
+                        "TKEEP mismatch on accepted output beat "
+                        f"{accepted_beats}: observed={tkeep:#x}, expected={expected_tkeep:#x}"
+                    )
+                accepted_pixels += beat_pixels
+
+                if stats.first_accept_cycle is None:
+                    stats.first_accept_cycle = cycle
+                stats.last_accept_cycle = cycle
+                accepted_beats += 1
+                prev_stall_payload = None
+                continue
+
+            # AXI rule: payload/sidebands must remain stable while stalled.
+            if not resolved:
+                tdata, tlast, tuser = self._sample(2), self._sample(3), self._sample(4)
+            stats.saw_stall = True
+            payload = (tdata, tlast, tuser, self._sample(5)) if has_tkeep else (tdata, tlast, tuser)
+            if prev_stall_payload is not None:
+                assert payload == prev_stall_payload, (
+                    "Output payload changed while stalled (VALID=1, READY=0). "
+                    f"prev={prev_stall_payload}, now={payload}"
+                )
+            prev_stall_payload = payload
+
+        stats.accepted_beats = accepted_beats
+        stats.accepted_pixels = accepted_pixels
+        return stats
@@ -2,16 +2,45 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import AsyncIterator, Callable
 
 import numpy as np
 from cocotb.triggers import SimTimeoutError, with_timeout
+from cocotb.utils import get_sim_time
 from cocotbext.axi import AxiStreamBus, AxiStreamSink
+from common.packing import decode_line, pixels_per_clock
+from common.timing import BeatTimestampRecorder, log_frame_pixels, wait_until_ns
+from common.video_timing import VideoTiming, VideoTimingStats
 from models.image_model import Image
 
 
+class _LineGatedAxiStreamSink(AxiStreamSink):
+    """AxiStreamSink whose TREADY can be closed on the edge that accepts TLAST.
+
+    cocotbext-axi samples ``pause`` before a clock edge and drives TREADY from that
+    sample after the edge, so pausing from a coroutine takes effect one to two
+    edges late. ``full()`` is evaluated after the beat of the current edge has
+    been queued, which makes it the hook for an exact per-line gate.
+    """
+
+    line_gated = False
+    line_open = False
+
+    def full(self) -> bool:
+        if self.line_gated and (not self.line_open or self.queue_occupancy_frames > 0):
+            return True
+        return super().full()
+
+    def open_line(self) -> None:
+        """Accept beats from the next clock edge until a line has been queued."""
+        self.line_open = True
+        self.wake_event.set()
+
+
 class AxiVideoStreamSink:
-    """Capture AXI4-Video frames and decode RGB payload."""
+    """Capture AXI4-Video frames and decode RGB payload (1, 2 or 4 pixels per clock)."""
 
     def __init__(
         self,
@@ -20,16 +49,24 @@ class AxiVideoStreamSink:
         i_rst_n,
         prefix: str = "m_axis_video",
         reset_active_level: bool = True,
+        record_timestamps: bool = False,
     ) -> None:
-        self._sink = AxiStreamSink(
+        self._sink = _LineGatedAxiStreamSink(
             bus=AxiStreamBus.from_prefix(dut, prefix),
             clock=i_clk,
             reset=i_rst_n,
             reset_active_level=reset_active_level,
         )
         self._byte_lanes = int(self._sink.byte_lanes)
+        self.pixels_per_clock = pixels_per_clock(self._byte_lanes)
         self._sink.log.setLevel(logging.WARNING)
 
+        # Optional per-beat acceptance times for throughput/latency metrics.
+        self.timestamps: BeatTimestampRecorder | None = None
+        if record_timestamps:
+            self.timestamps = BeatTimestampRecorder(dut, i_clk, prefix)
+            self.timestamps.start()
+
     def set_pause_generator(self, generator=None) -> None:
         """Apply optional TREADY backpressure pattern."""
         self._sink.set_pause_generator(generator)
@@ -38,60 +75,120 @@ class AxiVideoStreamSink:
         """Directly control sink pause (`True` stalls by deasserting TREADY)."""
         self._sink.pause = bool(paused)
 
-    @staticmethod
-    def _decode_line(
-        frame,
-        width: int,
-        *,
-        byte_lanes: int,
-    ) -> list[tuple[int, int, int]]:
-        data = bytes(frame.tdata)
-        if byte_lanes != 3:
-            raise AssertionError(
-                "AxiVideoStreamSink currently supports packed RGB24 only (3 byte lanes); "
-                f"got byte_lanes={byte_lanes}.",
-            )
-        expected_bytes = width * 3
-        if len(data) != expected_bytes:
-            raise AssertionError(
-                f"Line length mismatch on AXI stream: got {len(data)} bytes, expected {expected_bytes}",
-            )
-        if byte_lanes <= 0:
-            raise AssertionError(f"Invalid AXI byte lane count: {byte_lanes}")
-
-        pixels: list[tuple[int, int, int]] = []
-
-        for x in range(width):
-            base = x * 3
-            b = int(data[base + 0])
-            g = int(data[base + 1])
-            r = int(data[base + 2])
-            pixels.append((r, g, b))
-
-        return pixels
-
     async def recv_image(
         self,
         width: int,
         height: int,
         timeout_ns: int = 100_000,
+        on_line: Callable[[int, np.ndarray], None] | None = None,
     ) -> Image:
-        lines: list[list[tuple[int, int, int]]] = []
+        """Receive one frame; ``on_line(y, row)`` runs as soon as each line is decoded.
+
+        An exception raised by ``on_line`` (e.g. a scoreboard mismatch) propagates
+        immediately, so the remaining lines are never simulated.
+        """
+        frame_array = np.empty((height, width, 3), dtype=np.uint8)
 
         try:
             for y in range(height):
                 frame = await with_timeout(self._sink.recv(), timeout_ns, "ns")
-                pixels = self._decode_line(
-                    frame=frame,
-                    width=width,
+                decode_line(
+                    frame.tdata,
+                    width,
                     byte_lanes=self._byte_lanes,
+                    out=frame_array[y],
                 )
-
-                lines.append(pixels)
+                if on_line is not None:
+                    on_line(y, frame_array[y])
         except SimTimeoutError as exc:
             raise AssertionError(
                 f"Timed out waiting for output frame ({width}x{height}, {timeout_ns} ns per line)",
             ) from exc
 
-        frame_array = np.asarray(lines, dtype=np.uint8)
-        return Image(frame_array)
+        log_frame_pixels(width * height)
+        # The buffer was allocated here as (H, W, 3) uint8, so skip revalidation.
+        return Image.wrap(frame_array)
+
+    async def iter_images(
+        self,
+        width: int,
+        height: int,
+        count: int,
+        timeout_ns: int = 100_000,
+        on_line: Callable[[int, int, np.ndarray], None] | None = None,
+    ) -> AsyncIterator[Image]:
+        """Yield ``count`` consecutive frames as soon as each one is fully received.
+
+        ``on_line(frame_index, y, row)`` is the per-line hook of ``recv_image``.
+        """
+        for index in range(count):
+            yield await self.recv_image(
+                width=width,
+                height=height,
+                timeout_ns=timeout_ns,
+                on_line=None if on_line is None else functools.partial(on_line, index),
+            )
+
+    async def iter_images_timed(
+        self,
+        timing: VideoTiming,
+        count: int,
+        *,
+        start_ns: float | None = None,
+        stats: VideoTimingStats | None = None,
+        timeout_ns: int = 100_000,
+        on_line: Callable[[int, int, np.ndarray], None] | None = None,
+    ) -> AsyncIterator[Image]:
+        """Drain frames like a display: one line per line period, nothing in between.
+
+        TREADY is only released from the start of each line slot
+        (``start_ns + timing.line_start_ns(k, y)``, default start: now) until the
+        line's TLAST has been accepted, so the DUT has to buffer across blanking. A
+        line that completes after its slot ended counts as late in ``stats`` (a real
+        display would underflow). ``on_line(frame_index, y, row)`` as in ``iter_images``.
+
+        TREADY falls on the edge that accepts TLAST, so no beat of the next line gets
+        through early. It rises on the first clock edge after the slot starts, so
+        a line can be charged up to one clock period more than its transfer took.
+        """
+        stats = stats if stats is not None else VideoTimingStats(timing.line_period_ns)
+        if start_ns is None:
+            start_ns = get_sim_time("ns")
+        width, height = timing.width, timing.height
+
+        sink = self._sink
+        sink.line_gated = True
+        sink.line_open = False
+        try:
+            for index in range(count):
+                frame_array = np.empty((height, width, 3), dtype=np.uint8)
+                for y in range(height):
+                    slot_ns = start_ns + timing.line_start_ns(index, y)
+                    await wait_until_ns(slot_ns)
+                    sink.open_line()
+                    try:
+                        frame = await with_timeout(sink.recv(), timeout_ns, "ns")
+                    except SimTimeoutError as exc:
+                        raise AssertionError(
+                            f"Timed out waiting for line {y} of timed frame {index} "
+                            f"({timing.name}, {timeout_ns} ns per line)",
+                        ) from exc
+                    # The gate already closed when TLAST was queued; keep it closed
+                    # now that the line has been taken out of the queue.
+                    sink.line_open = False
+                    stats.record(index, y, get_sim_time("ns") - slot_ns)
+
+                    decode_line(
+                        frame.tdata,
+                        width,
+                        byte_lanes=self._byte_lanes,
+                        out=frame_array[y],
+                    )
+                    if on_line is not None:
+                        on_line(index, y, frame_array[y])
+
+                log_frame_pixels(width * height)
+                yield Image.wrap(frame_array)
+        finally:
+            sink.line_gated = False
+            sink.wake_event.set()
@@ -0,0 +1,139 @@
+"""Simulation-speed profiling for ``tb-sim --profile``."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from xml.etree import ElementTree
+
+PIXEL_LOG_ENV = "TB_PIXEL_LOG"
+"""Mirrors ``common.timing.PIXEL_LOG_ENV``; kept here so the runner never imports cocotb."""
+
+PIXEL_LOG_NAME = "pixels.jsonl"
+PSTATS_NAME = "cocotb.pstat"
+PROFILE_NAME = "profile.json"
+
+
+@dataclass(slots=True)
+class TestProfile:
+    """Speed of one cocotb test, from ``results.xml`` plus the sink pixel log."""
+
+    test: str
+    wall_time_s: float
+    sim_time_ns: float
+    cycles: float
+    pixels: int = 0
+
+    @property
+    def cycles_per_s(self) -> float:
+        return self.cycles / self.wall_time_s if self.wall_time_s > 0 else 0.0
+
+    @property
+    def pixels_per_s(self) -> float:
+        return self.pixels / self.wall_time_s if self.wall_time_s > 0 else 0.0
+
+
+@dataclass(slots=True)
+class TargetProfile:
+    """Build and simulation timing of one target."""
+
+    target: str
+    build_time_s: float | None
+    """HDL analyze/elaborate time; ``None`` when the build manifest was current."""
+
+    sim_wall_time_s: float
+    """Wall time of the simulator run(s), including simulator start-up."""
+
+    clock_period_ns: float
+    tests: list[TestProfile] = field(default_factory=list)
+    pstats: list[str] = field(default_factory=list)
+    """cProfile dumps of the cocotb Python side (``--cprofile``)."""
+
+    def write(self, path: Path) -> None:
+        path.write_text(json.dumps(asdict(self), indent=2) + "\n", encoding="utf-8")
+
+    @classmethod
+    def read(cls, path: Path) -> TargetProfile:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["tests"] = [TestProfile(**test) for test in data["tests"]]
+        return cls(**data)
+
+
+def _read_pixel_log(path: Path) -> list[tuple[float, int]]:
+    if not path.is_file():
+        return []
+    entries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            record = json.loads(line)
+            entries.append((float(record["sim_time_ns"]), int(record["pixels"])))
+    return entries
+
+
+def _properties(testcase: ElementTree.Element) -> dict[str, str]:
+    return {
+        prop.get("name", ""): prop.get("value", "")
+        for prop in testcase.iter("property")
+    }
+
+
+def load_test_profiles(run_dirs: Iterable[Path], clock_period_ns: float) -> list[TestProfile]:
+    """Read ``results.xml`` and the pixel log of each simulator run directory.
+
+    Frames in the pixel log are attributed to the test whose simulated-time window
+    (``sim_time_start``..``sim_time_stop``) contains them.
+    """
+    profiles: list[TestProfile] = []
+    for run_dir in run_dirs:
+        results_xml = run_dir / "results.xml"
+        if not results_xml.is_file():
+            continue
+        pixel_log = _read_pixel_log(run_dir / PIXEL_LOG_NAME)
+        for testcase in ElementTree.parse(results_xml).getroot().iter("testcase"):
+            props = _properties(testcase)
+            start = float(props.get("sim_time_start", 0) or 0)
+            stop = float(props.get("sim_time_stop", 0) or 0)
+            sim_time_ns = float(props.get("sim_time_duration", stop - start) or 0)
+            profiles.append(
+                TestProfile(
+                    test=testcase.get("name", "?"),
+                    wall_time_s=float(testcase.get("time", 0) or 0),
+                    sim_time_ns=sim_time_ns,
+                    cycles=sim_time_ns / clock_period_ns,
+                    pixels=sum(count for time_ns, count in pixel_log if start < time_ns <= stop),
+                ),
+            )
+    return profiles
+
+
+def _si(value: float) -> str:
+    for scale, suffix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if value >= scale:
+            return f"{value / scale:.2f}{suffix}"
+    return f"{value:.0f}"
+
+
+def format_profile(profiles: Iterable[TargetProfile]) -> str:
+    """Render a per-target/per-test speed table."""
+    header = (
+        f"{'target / test':44s} {'build s':>8s} {'wall s':>8s} {'sim us':>10s} "
+        f"{'cycles/s':>9s} {'pixels/s':>9s}"
+    )
+    lines = [header, "-" * len(header)]
+    for profile in profiles:
+        build = "cached" if profile.build_time_s is None else f"{profile.build_time_s:.2f}"
+        sim_us = sum(test.sim_time_ns for test in profile.tests) / 1e3
+        lines.append(
+            f"{profile.target:44s} {build:>8s} {profile.sim_wall_time_s:8.2f} {sim_us:10.1f}",
+        )
+        for test in profile.tests:
+            lines.append(
+                f"  {test.test:42s} {'':>8s} {test.wall_time_s:8.2f} "
+                f"{test.sim_time_ns / 1e3:10.1f} {_si(test.cycles_per_s):>9s} "
+                f"{_si(test.pixels_per_s):>9s}",
+            )
+        for pstats_path in profile.pstats:
+            lines.append(f"  cProfile dump: {pstats_path}")
+    return "\n".join(lines)
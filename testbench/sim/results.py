@@ -0,0 +1,152 @@
+"""Result aggregation for multi-target ``tb-sim`` runs."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from xml.etree import ElementTree
+
+
+@dataclass(slots=True)
+class TargetResult:
+    """Outcome of simulating one target from ``targets.toml``."""
+
+    target: str
+    wall_time_s: float
+    log_dir: Path
+    results_xml: Path | None = None
+    num_tests: int = 0
+    num_failed: int = 0
+    error: str | None = None
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and self.results_xml is not None and self.num_failed == 0
+
+    @property
+    def status(self) -> str:
+        if self.error is not None:
+            return "ERROR"
+        return "PASS" if self.passed else "FAIL"
+
+    def load_counts(self) -> None:
+        """Fill test/failure counts from ``results_xml``."""
+        if self.results_xml is None or not self.results_xml.is_file():
+            self.error = self.error or f"Results file not found: {self.results_xml}"
+            return
+
+        self.num_tests = 0
+        self.num_failed = 0
+        root = ElementTree.parse(self.results_xml).getroot()
+        for testcase in root.iter("testcase"):
+            self.num_tests += 1
+            if testcase.find("failure") is not None or testcase.find("error") is not None:
+                self.num_failed += 1
+
+
+def failed_tests(results_xml: Path) -> list[str]:
+    """Names of the failed or errored test cases in ``results_xml``, in file order."""
+    root = ElementTree.parse(results_xml).getroot()
+    return [
+        testcase.get("name", "")
+        for testcase in root.iter("testcase")
+        if testcase.find("failure") is not None or testcase.find("error") is not None
+    ]
+
+
+_COUNT_ATTRIBUTES = ("tests", "failures", "errors", "skipped")
+
+
+def _append_suites(
+    merged: ElementTree.Element,
+    suites_by_name: dict[str, ElementTree.Element],
+    xml_path: Path,
+    prefix: str | None,
+) -> None:
+    """Copy the suites of ``xml_path`` into ``merged``, folding suites with equal names."""
+    root = ElementTree.parse(xml_path).getroot()
+    suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+
+    for suite in suites:
+        name = suite.get("name", "cocotb")
+        if prefix:
+            name = f"{prefix}.{name}"
+
+        existing = suites_by_name.get(name)
+        if existing is None:
+            suite.set("name", name)
+            merged.append(suite)
+            suites_by_name[name] = suite
+            continue
+
+        for child in list(suite):
+            existing.append(child)
+        for attribute in _COUNT_ATTRIBUTES:
+            total = int(existing.get(attribute, 0)) + int(suite.get(attribute, 0))
+            existing.set(attribute, str(total))
+        total_time = float(existing.get("time", 0)) + float(suite.get("time", 0))
+        existing.set("time", f"{total_time:.3f}")
+
+
+def _write_merged(merged: ElementTree.Element, output_path: Path) -> Path:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    ElementTree.ElementTree(merged).write(output_path, encoding="utf-8", xml_declaration=True)
+    return output_path
+
+
+def merge_xunit_files(
+    xml_paths: Iterable[Path],
+    output_path: Path,
+    *,
+    name: str = "cocotb tests",
+) -> Path:
+    """Merge xUnit files of one target (e.g. test shards) into a single document.
+
+    Suites with the same name are folded into one so the merged file looks like a
+    single unsharded cocotb run.
+    """
+    merged = ElementTree.Element("testsuites", name=name)
+    suites_by_name: dict[str, ElementTree.Element] = {}
+    for xml_path in xml_paths:
+        _append_suites(merged, suites_by_name, xml_path, prefix=None)
+    return _write_merged(merged, output_path)
+
+
+def merge_results_xml(results: Iterable[TargetResult], output_path: Path) -> Path:
+    """Merge per-target xUnit files into one ``testsuites`` document.
+
+    Each copied ``testsuite`` is renamed to ``<target>.<suite>`` so suites with the
+    same test module (for example two toplevels sharing one module) stay distinct.
+    """
+    merged = ElementTree.Element("testsuites", name="tb-sim regression")
+    suites_by_name: dict[str, ElementTree.Element] = {}
+
+    for result in results:
+        if result.results_xml is None or not result.results_xml.is_file():
+            continue
+        _append_suites(merged, suites_by_name, result.results_xml, prefix=result.target)
+
+    return _write_merged(merged, output_path)
+
+
+def format_summary(results: Iterable[TargetResult]) -> str:
+    """Render a fixed-width summary table with per-target wall times."""
+    results = list(results)
+    lines = [
+        f"{'target':28s} {'status':>6s} {'tests':>5s} {'failed':>6s} {'wall [s]':>9s}",
+        "-" * 58,
+    ]
+    for result in results:
+        lines.append(
+            f"{result.target:28s} {result.status:>6s} {result.num_tests:5d} "
+            f"{result.num_failed:6d} {result.wall_time_s:9.1f}",
+        )
+        if result.error is not None:
+            lines.append(f"    {result.error} (logs: {result.log_dir})")
+
+    total_tests = sum(result.num_tests for result in results)
+    total_failed = sum(result.num_failed for result in results)
+    lines.append("-" * 58)
+    lines.append(f"{'total':28s} {'':>6s} {total_tests:5d} {total_failed:6d}")
+    return "\n".join(lines)
@@ -3,12 +3,43 @@
 from __future__ import annotations
 
 import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
 import tomllib
 from cocotb_tools.runner import get_runner
 
+from sim.profiling import (
+    PIXEL_LOG_ENV,
+    PIXEL_LOG_NAME,
+    PROFILE_NAME,
+    PSTATS_NAME,
+    TargetProfile,
+    format_profile,
+    load_test_profiles,
+)
+from sim.results import (
+    TargetResult,
+    failed_tests,
+    format_summary,
+    merge_results_xml,
+    merge_xunit_files,
+)
+
+
+BUILD_MANIFEST_NAME = "build_manifest.json"
+WAVE_MODES = ("on", "off", "on-failure")
+WAVE_RERUN_DIR = "wave_reruns"
+DEFAULT_MAX_WAVE_RERUNS = 4
+
 
 def _parse_bool(value: Any) -> bool:
     if isinstance(value, bool):
@@ -20,6 +51,15 @@ def _parse_bool(value: Any) -> bool:
     return False
 
 
+def _parse_waves(value: Any) -> str:
+    """Normalize a ``waves`` setting to one of ``WAVE_MODES`` (booleans map to on/off)."""
+    if isinstance(value, str):
+        mode = value.strip().lower().replace("_", "-")
+        if mode in WAVE_MODES:
+            return mode
+    return "on" if _parse_bool(value) else "off"
+
+
 def _sanitize_name(value: str) -> str:
     sanitized = "".join(ch if ch.isalnum() or ch in {"_", "-"} else "_" for ch in value)
     return sanitized.strip("_") or "tb"
@@ -123,6 +163,77 @@ def _collect_sources(repo_root: Path, config: dict[str, Any]) -> list[Path]:
     raise ValueError("Target must define either 'sources' or 'component'.")
 
 
+def _build_fingerprint(
+    *,
+    sim: str,
+    toplevel: str,
+    sources: list[Path],
+    build_options: dict[str, Any],
+) -> dict[str, Any]:
+    """Describe everything that influences the HDL build, keyed by source content hash."""
+    simulator_path = shutil.which(sim)
+    source_entries = [
+        {"path": str(source), "sha256": hashlib.sha256(source.read_bytes()).hexdigest()}
+        for source in sources
+    ]
+    inputs = {
+        "sim": sim,
+        "simulator_path": simulator_path,
+        "toplevel": toplevel,
+        "build_options": build_options,
+        "sources": source_entries,
+    }
+    encoded = json.dumps(inputs, sort_keys=True).encode("utf-8")
+    return {"fingerprint": hashlib.sha256(encoded).hexdigest(), **inputs}
+
+
+def _build_is_current(manifest_path: Path, build_dir: Path, fingerprint: str) -> bool:
+    """Return True when ``build_dir`` was produced from an identical fingerprint."""
+    if not build_dir.is_dir() or not manifest_path.is_file():
+        return False
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return manifest.get("fingerprint") == fingerprint
+
+
+def _is_cocotb_test_decorator(node: ast.expr) -> bool:
+    target = node.func if isinstance(node, ast.Call) else node
+    return (
+        isinstance(target, ast.Attribute)
+        and target.attr == "test"
+        and isinstance(target.value, ast.Name)
+        and target.value.id == "cocotb"
+    )
+
+
+def _discover_cocotb_tests(tb_root: Path, test_module: str) -> list[str]:
+    """List ``@cocotb.test`` functions of the test module(s) in definition order.
+
+    The modules are parsed, not imported, so discovery needs no simulator.
+    """
+    names: list[str] = []
+    for module in test_module.split(","):
+        module = module.strip()
+        if not module:
+            continue
+        module_path = tb_root.joinpath(*module.split(".")).with_suffix(".py")
+        tree = ast.parse(module_path.read_text(encoding="utf-8"), filename=str(module_path))
+        for node in tree.body:
+            if isinstance(node, (ast.AsyncFunctionDef, ast.FunctionDef)) and any(
+                _is_cocotb_test_decorator(decorator) for decorator in node.decorator_list
+            ):
+                names.append(node.name)
+    return names
+
+
+def _split_shards(test_names: list[str], shards: int) -> list[list[str]]:
+    """Distribute tests round-robin over at most ``shards`` non-empty shards."""
+    count = max(1, min(shards, len(test_names)))
+    return [test_names[index::count] for index in range(count)]
+
+
 def _build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run cocotb simulation target.")
     parser.add_argument(
@@ -131,23 +242,61 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         help="List available targets and exit.",
     )
     parser.add_argument("--target", help="Target name from targets.toml.")
+    parser.add_argument(
+        "--targets",
+        help="Comma-separated target names to run in parallel.",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Run every target from targets.toml in parallel.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximum number of targets simulated concurrently (default: CPU count).",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=None,
+        help="Split each target's cocotb tests over N parallel simulator processes.",
+    )
     parser.add_argument("--toplevel", help="HDL toplevel entity/module name.")
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Ignore the build manifest and re-analyze/elaborate all HDL sources.",
+    )
+    parser.add_argument(
+        "--waves",
+        choices=WAVE_MODES,
+        help=(
+            "Override the targets' 'waves' setting. 'on-failure' runs without waves and "
+            "re-runs each failing test alone with waves on."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Report build time, simulation wall time, cycles/s and pixels/s per test.",
+    )
+    parser.add_argument(
+        "--cprofile",
+        action="store_true",
+        help="Also dump a cProfile (pstats) of the cocotb Python side per simulator run.",
+    )
     return parser
 
 
-def _resolve_config(tb_root: Path, args: argparse.Namespace) -> dict[str, Any]:
-    defaults, targets = _load_targets(tb_root)
-
-    if args.list_targets:
-        for name, cfg in sorted(targets.items()):
-            description = cfg.get("description", "")
-            print(f"{name:28s} {description}")
-        raise SystemExit(0)
-
-    target_name = args.target or defaults.get("target")
-    if not target_name:
-        target_name = "example_passthrough"
-
+def _target_config(
+    defaults: dict[str, Any],
+    targets: dict[str, dict[str, Any]],
+    target_name: str,
+    toplevel: str | None = None,
+) -> dict[str, Any]:
     if target_name not in targets:
         valid = ", ".join(sorted(targets.keys()))
         raise ValueError(f"Unknown target '{target_name}'. Valid targets: {valid}")
@@ -156,8 +305,8 @@ def _resolve_config(tb_root: Path, args: argparse.Namespace) -> dict[str, Any]:
     config.update(targets[target_name])
     config["target"] = target_name
 
-    if args.toplevel:
-        config["toplevel"] = args.toplevel
+    if toplevel:
+        config["toplevel"] = toplevel
 
     required_keys = ("sim", "toplevel", "test_module")
     missing = [k for k in required_keys if not config.get(k)]
@@ -166,70 +315,587 @@ def _resolve_config(tb_root: Path, args: argparse.Namespace) -> dict[str, Any]:
             f"Target '{target_name}' is missing required fields: {', '.join(missing)}",
         )
 
-    config["waves"] = _parse_bool(config.get("waves", True))
+    config["waves"] = _parse_waves(config.get("waves", True))
     return config
 
 
-def main() -> None:
-    tb_root = Path(__file__).resolve().parents[1]
-    repo_root = tb_root.parent
-    args = _build_arg_parser().parse_args()
-    config = _resolve_config(tb_root=tb_root, args=args)
+def _resolve_configs(tb_root: Path, args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Resolve the target selection from the CLI into ordered target configs."""
+    defaults, targets = _load_targets(tb_root)
 
-    sim = str(config["sim"])
-    component = str(config["component"]) if config.get("component") else None
-    toplevel = str(config["toplevel"])
-    test_module = str(config["test_module"])
-    waves = bool(config["waves"])
+    if args.list_targets:
+        for name, cfg in sorted(targets.items()):
+            description = cfg.get("description", "")
+            print(f"{name:28s} {description}")
+        raise SystemExit(0)
 
-    sources = _collect_sources(repo_root=repo_root, config=config)
+    if args.all or args.targets:
+        if args.target or args.toplevel:
+            raise ValueError("--target/--toplevel cannot be combined with --all/--targets.")
+        if args.all:
+            target_names = list(targets.keys())
+        else:
+            target_names = [name.strip() for name in args.targets.split(",") if name.strip()]
+            if not target_names:
+                raise ValueError("--targets must name at least one target.")
+        target_names = list(dict.fromkeys(target_names))
+        return [_target_config(defaults, targets, name) for name in target_names]
+
+    target_name = args.target or defaults.get("target")
+    if not target_name:
+        target_name = "example_passthrough"
+
+    return [_target_config(defaults, targets, target_name, toplevel=args.toplevel)]
 
-    tb_name = _derive_tb_name(test_module)
+
+def _target_sim_root(tb_root: Path, config: dict[str, Any]) -> Path:
+    component = str(config["component"]) if config.get("component") else None
+    toplevel = str(config["toplevel"])
+    tb_name = _derive_tb_name(str(config["test_module"]))
     if component:
         build_key = component.lower()
     else:
         build_key = _sanitize_name(str(config["target"])).lower()
-    sim_root = tb_root / "sim_build" / tb_name / f"{build_key}_{toplevel}"
+    return tb_root / "sim_build" / tb_name / f"{build_key}_{toplevel}"
+
+
+def _profile_env(run_dir: Path, *, profile: bool, cprofile: bool) -> dict[str, str]:
+    """Environment enabling the sink pixel log and/or cocotb's cProfile hook.
+
+    Stale logs from a previous run are removed first; the pixel log is appended to.
+    """
+    env: dict[str, str] = {}
+    if profile:
+        pixel_log = run_dir / PIXEL_LOG_NAME
+        pixel_log.unlink(missing_ok=True)
+        env[PIXEL_LOG_ENV] = str(pixel_log)
+    if cprofile:
+        # cocotb writes cocotb.pstat into the simulator working directory.
+        (run_dir / PSTATS_NAME).unlink(missing_ok=True)
+        env["COCOTB_ENABLE_PROFILING"] = "1"
+    return env
+
+
+def _write_target_profile(
+    *,
+    config: dict[str, Any],
+    sim_root: Path,
+    run_dirs: list[Path],
+    build_time_s: float | None,
+    sim_wall_time_s: float,
+) -> TargetProfile:
+    clock_period_ns = float(config.get("clock_period_ns", 10))
+    profile = TargetProfile(
+        target=str(config["target"]),
+        build_time_s=build_time_s,
+        sim_wall_time_s=sim_wall_time_s,
+        clock_period_ns=clock_period_ns,
+        tests=load_test_profiles(run_dirs, clock_period_ns),
+        pstats=[
+            str(run_dir / PSTATS_NAME)
+            for run_dir in run_dirs
+            if (run_dir / PSTATS_NAME).is_file()
+        ],
+    )
+    profile.write(sim_root / PROFILE_NAME)
+    return profile
+
+
+def _run_target(
+    *,
+    tb_root: Path,
+    repo_root: Path,
+    config: dict[str, Any],
+    rebuild: bool = False,
+    log_to_files: bool = False,
+    shards: int = 1,
+    profile: bool = False,
+    cprofile: bool = False,
+) -> Path:
+    """Build (if needed) and simulate one target; return its ``results.xml`` path.
+
+    With ``log_to_files`` the build and simulator output go to ``build.log`` and
+    ``sim.log`` in the target's sim_build directory instead of the console, so
+    targets running in parallel do not interleave their output.
+
+    With ``shards > 1`` the target's tests are split over parallel simulator
+    processes that share the build (see ``_run_test_shards``).
+
+    With ``profile``/``cprofile`` a ``profile.json`` speed report is written to the
+    target's sim_build directory (and printed unless logging to files).
+
+    With ``waves = "on-failure"`` the target runs without waves and every failing
+    test is re-run alone with waves on (see ``_rerun_failures_with_waves``).
+    """
+    sim = str(config["sim"])
+    toplevel = str(config["toplevel"])
+    test_module = str(config["test_module"])
+    waves_mode = _parse_waves(config["waves"])
+    waves = waves_mode == "on"
+
+    sources = _collect_sources(repo_root=repo_root, config=config)
+
+    sim_root = _target_sim_root(tb_root=tb_root, config=config)
     build_dir = sim_root / "build"
     # GHDL resolves the work library from the current working directory.
     # Run tests in build_dir to keep entity/config lookup consistent.
     test_dir = build_dir if sim == "ghdl" else (sim_root / "run")
+    build_log = sim_root / "build.log" if log_to_files else None
+    sim_log = sim_root / "sim.log" if log_to_files else None
+    if log_to_files:
+        sim_root.mkdir(parents=True, exist_ok=True)
+    if profile or cprofile:
+        # Never report a previous run's numbers if this one fails early.
+        (sim_root / PROFILE_NAME).unlink(missing_ok=True)
     runner = get_runner(sim)
 
     hdl_library = "top"
 
-    runner.build(
+    build_manifest = _build_fingerprint(
+        sim=sim,
+        toplevel=toplevel,
         sources=sources,
-        hdl_toplevel=toplevel,
-        hdl_library=hdl_library,
-        build_dir=build_dir,
-        always=True,
+        build_options={"hdl_library": hdl_library},
     )
+    manifest_path = sim_root / BUILD_MANIFEST_NAME
+    build_time_s: float | None = None
+    if not rebuild and _build_is_current(
+        manifest_path=manifest_path,
+        build_dir=build_dir,
+        fingerprint=build_manifest["fingerprint"],
+    ):
+        print(f"HDL build up to date, skipping: {build_dir}")
+    else:
+        # Drop the old manifest first so an interrupted build is never treated as current.
+        manifest_path.unlink(missing_ok=True)
+        build_start = time.perf_counter()
+        runner.build(
+            sources=sources,
+            hdl_toplevel=toplevel,
+            hdl_library=hdl_library,
+            build_dir=build_dir,
+            always=True,
+            log_file=build_log,
+        )
+        build_time_s = time.perf_counter() - build_start
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(
+            json.dumps(build_manifest, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+
+    test_names: list[str] = []
+    if shards > 1:
+        test_names = _discover_cocotb_tests(tb_root=tb_root, test_module=test_module)
+
+    sim_start = time.perf_counter()
+    if len(test_names) > 1:
+        shard_tests = _split_shards(test_names, shards)
+        run_dirs = [sim_root / f"shard_{index}" for index in range(len(shard_tests))]
+        results_xml = _run_test_shards(
+            sim=sim,
+            toplevel=toplevel,
+            hdl_library=hdl_library,
+            test_module=test_module,
+            build_dir=build_dir,
+            sim_root=sim_root,
+            waves=waves,
+            shard_tests=shard_tests,
+            profile=profile,
+            cprofile=cprofile,
+        )
+    else:
+        run_dirs = [test_dir]
+        results_xml = Path(
+            runner.test(
+                hdl_toplevel=toplevel,
+                hdl_toplevel_library=hdl_library,
+                test_module=test_module,
+                build_dir=build_dir,
+                test_dir=test_dir,
+                waves=waves,
+                log_file=sim_log,
+                extra_env=_profile_env(test_dir, profile=profile, cprofile=cprofile),
+            ),
+        )
+        if waves:
+            _report_waves(runner=runner, test_dir=test_dir)
+
+    if profile or cprofile:
+        target_profile = _write_target_profile(
+            config=config,
+            sim_root=sim_root,
+            run_dirs=run_dirs,
+            build_time_s=build_time_s,
+            sim_wall_time_s=time.perf_counter() - sim_start,
+        )
+        if not log_to_files:
+            print(format_profile([target_profile]))
+
+    if waves_mode == "on-failure":
+        _rerun_failures_with_waves(
+            sim=sim,
+            toplevel=toplevel,
+            hdl_library=hdl_library,
+            test_module=test_module,
+            build_dir=build_dir,
+            sim_root=sim_root,
+            results_xml=results_xml,
+            max_reruns=int(config.get("max_wave_reruns", DEFAULT_MAX_WAVE_RERUNS)),
+        )
+
+    return results_xml
+
+
+def _report_waves(*, runner: Any, test_dir: Path) -> None:
+    wave_name = None
+    public_waves_file = getattr(runner, "waves_file", None)
+    if callable(public_waves_file):
+        wave_name = public_waves_file()
+    else:
+        private_waves_file = getattr(runner, "_waves_file", None)
+        if callable(private_waves_file):
+            wave_name = private_waves_file()
+    if wave_name:
+        wave_path = test_dir / wave_name
+        if wave_path.exists():
+            print(f"Waveform generated: {wave_path}")
+        else:
+            print(f"Waveform expected at: {wave_path}")
 
-    runner.test(
+
+def _prepare_shard_dir(*, sim: str, toplevel: str, build_dir: Path, shard_dir: Path) -> list[str]:
+    """Create a shard test directory and return extra simulator run arguments.
+
+    GHDL looks up the analyzed work library relative to the working directory, so
+    shards point it back at the shared build with ``--workdir``. Backends that
+    elaborate to an executable (GCC/LLVM) get a symlink to it in the shard dir.
+    """
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    if sim != "ghdl":
+        return []
+
+    executable = build_dir / toplevel.lower()
+    link = shard_dir / executable.name
+    if executable.is_file() and not link.exists():
+        link.symlink_to(executable)
+    return [f"--workdir={build_dir}"]
+
+
+def _run_test_shard(
+    *,
+    sim: str,
+    toplevel: str,
+    hdl_library: str,
+    test_module: str,
+    build_dir: Path,
+    shard_dir: Path,
+    waves: bool,
+    tests: list[str],
+    profile: bool = False,
+    cprofile: bool = False,
+) -> Path:
+    test_args = _prepare_shard_dir(
+        sim=sim,
+        toplevel=toplevel,
+        build_dir=build_dir,
+        shard_dir=shard_dir,
+    )
+    # A runner instance carries per-run state, so every shard gets its own.
+    runner = get_runner(sim)
+    results_xml = runner.test(
         hdl_toplevel=toplevel,
         hdl_toplevel_library=hdl_library,
         test_module=test_module,
+        test_filter=r"\.(" + "|".join(re.escape(name) for name in tests) + r")$",
+        test_args=test_args,
         build_dir=build_dir,
-        test_dir=test_dir,
+        test_dir=shard_dir,
         waves=waves,
+        log_file=shard_dir / "sim.log",
+        extra_env=_profile_env(shard_dir, profile=profile, cprofile=cprofile),
     )
-
     if waves:
-        wave_name = None
-        public_waves_file = getattr(runner, "waves_file", None)
-        if callable(public_waves_file):
-            wave_name = public_waves_file()
-        else:
-            private_waves_file = getattr(runner, "_waves_file", None)
-            if callable(private_waves_file):
-                wave_name = private_waves_file()
-        if wave_name:
-            wave_path = test_dir / wave_name
-            if wave_path.exists():
-                print(f"Waveform generated: {wave_path}")
-            else:
-                print(f"Waveform expected at: {wave_path}")
+        _report_waves(runner=runner, test_dir=shard_dir)
+    return Path(results_xml)
+
+
+def _run_test_shards(
+    *,
+    sim: str,
+    toplevel: str,
+    hdl_library: str,
+    test_module: str,
+    build_dir: Path,
+    sim_root: Path,
+    waves: bool,
+    shard_tests: list[list[str]],
+    profile: bool = False,
+    cprofile: bool = False,
+) -> Path:
+    """Run test shards concurrently and merge their results into ``sim_root/results.xml``.
+
+    Each shard is one simulator subprocess with its own test directory and an exact
+    test-name filter. Threads are enough here: the Python side only waits on the
+    simulator, and it avoids nesting process pools under ``--all``.
+    """
+    shard_count = len(shard_tests)
+    print(f"Running {shard_count} test shard(s) for {test_module}")
+
+    shard_results: list[Path | None] = [None] * shard_count
+    failures: list[str] = []
+    with ThreadPoolExecutor(max_workers=shard_count) as pool:
+        futures = {
+            pool.submit(
+                _run_test_shard,
+                sim=sim,
+                toplevel=toplevel,
+                hdl_library=hdl_library,
+                test_module=test_module,
+                build_dir=build_dir,
+                shard_dir=sim_root / f"shard_{index}",
+                waves=waves,
+                tests=tests,
+                profile=profile,
+                cprofile=cprofile,
+            ): index
+            for index, tests in enumerate(shard_tests)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            shard_dir = sim_root / f"shard_{index}"
+            try:
+                shard_results[index] = future.result()
+            except (Exception, SystemExit) as exc:
+                failures.append(f"shard {index} ({shard_dir}): {type(exc).__name__}: {exc}")
+                # A crashed simulator may still have written partial results.
+                partial = shard_dir / "results.xml"
+                shard_results[index] = partial if partial.is_file() else None
+            print(f"  shard {index}: {', '.join(shard_tests[index])}")
+
+    merged = merge_xunit_files(
+        [path for path in shard_results if path is not None],
+        sim_root / "results.xml",
+    )
+    if failures:
+        raise RuntimeError("Test shard(s) failed to complete: " + "; ".join(failures))
+    return merged
+
+
+def _rerun_failures_with_waves(
+    *,
+    sim: str,
+    toplevel: str,
+    hdl_library: str,
+    test_module: str,
+    build_dir: Path,
+    sim_root: Path,
+    results_xml: Path,
+    max_reruns: int,
+) -> list[Path]:
+    """Re-run each failed test of ``results_xml`` alone with waves on.
+
+    Every re-run gets its own ``sim_root/wave_reruns/<test>`` directory, so the
+    dump only covers that test and the original results stay untouched. Dumps of
+    an earlier run are removed first, so the directory only ever holds waves of
+    tests that failed this time. Returns the re-run directories.
+    """
+    rerun_root = sim_root / WAVE_RERUN_DIR
+    shutil.rmtree(rerun_root, ignore_errors=True)
+    if not results_xml.is_file():
+        return []
+
+    failed = failed_tests(results_xml)
+    if len(failed) > max_reruns:
+        print(
+            f"{len(failed)} tests failed; dumping waves for the first {max_reruns} only "
+            "(raise 'max_wave_reruns' in targets.toml for more).",
+        )
+
+    rerun_dirs = []
+    for name in failed[:max_reruns]:
+        test_dir = rerun_root / _sanitize_name(name)
+        print(f"Re-running failed test {name} with waves in {test_dir}")
+        try:
+            _run_test_shard(
+                sim=sim,
+                toplevel=toplevel,
+                hdl_library=hdl_library,
+                test_module=test_module,
+                build_dir=build_dir,
+                shard_dir=test_dir,
+                waves=True,
+                tests=[name],
+            )
+        except (Exception, SystemExit) as exc:
+            print(f"  wave re-run of {name} did not complete: {type(exc).__name__}: {exc}")
+        rerun_dirs.append(test_dir)
+    return rerun_dirs
+
+
+def _target_shards(config: dict[str, Any], cli_shards: int | None) -> int:
+    """CLI ``--shards`` wins over a target's ``shards`` entry; default is unsharded."""
+    shards = cli_shards if cli_shards is not None else int(config.get("shards", 1))
+    if shards < 1:
+        raise ValueError(f"Shard count must be >= 1, got {shards}.")
+    return shards
+
+
+def _run_target_job(
+    tb_root: Path,
+    repo_root: Path,
+    config: dict[str, Any],
+    rebuild: bool,
+    shards: int,
+    profile: bool = False,
+    cprofile: bool = False,
+) -> TargetResult:
+    """Process-pool entry point: run one target and never raise."""
+    target = str(config["target"])
+    sim_root = _target_sim_root(tb_root=tb_root, config=config)
+    start = time.perf_counter()
+    try:
+        results_xml = _run_target(
+            tb_root=tb_root,
+            repo_root=repo_root,
+            config=config,
+            rebuild=rebuild,
+            log_to_files=True,
+            shards=shards,
+            profile=profile,
+            cprofile=cprofile,
+        )
+    except (Exception, SystemExit) as exc:
+        # cocotb's runner exits via SystemExit when the simulator itself fails.
+        return TargetResult(
+            target=target,
+            wall_time_s=time.perf_counter() - start,
+            log_dir=sim_root,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+
+    result = TargetResult(
+        target=target,
+        wall_time_s=time.perf_counter() - start,
+        log_dir=sim_root,
+        results_xml=results_xml,
+    )
+    result.load_counts()
+    return result
+
+
+def _run_targets_parallel(
+    *,
+    tb_root: Path,
+    repo_root: Path,
+    configs: list[dict[str, Any]],
+    jobs: int | None,
+    rebuild: bool,
+    shards: int | None,
+    profile: bool = False,
+    cprofile: bool = False,
+) -> list[TargetResult]:
+    max_workers = max(1, min(jobs or os.cpu_count() or 1, len(configs)))
+    print(f"Running {len(configs)} target(s) with up to {max_workers} parallel job(s)")
+
+    results: dict[str, TargetResult] = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(
+                _run_target_job,
+                tb_root,
+                repo_root,
+                config,
+                rebuild,
+                _target_shards(config, shards),
+                profile,
+                cprofile,
+            ): config
+            for config in configs
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.target] = result
+            print(f"[{result.status:>5s}] {result.target} ({result.wall_time_s:.1f} s)")
+
+    # Report in the order the targets were requested, not completion order.
+    return [results[str(config["target"])] for config in configs]
+
+
+def profile_target(
+    target: str,
+    *,
+    overrides: dict[str, Any] | None = None,
+    log_to_files: bool = True,
+) -> TargetProfile:
+    """Build and simulate one ``targets.toml`` target with profiling; return its report.
+
+    ``overrides`` replace target fields for this run only (e.g. ``target``,
+    ``test_module`` or ``waves``). This is the entry point ``tb-bench`` uses.
+    """
+    tb_root = Path(__file__).resolve().parents[1]
+    defaults, targets = _load_targets(tb_root)
+    config = _target_config(defaults, targets, target)
+    if overrides:
+        config.update(overrides)
+        config["waves"] = _parse_waves(config["waves"])
+
+    _run_target(
+        tb_root=tb_root,
+        repo_root=tb_root.parent,
+        config=config,
+        log_to_files=log_to_files,
+        profile=True,
+    )
+    return TargetProfile.read(_target_sim_root(tb_root, config) / PROFILE_NAME)
+
+
+def main() -> None:
+    tb_root = Path(__file__).resolve().parents[1]
+    repo_root = tb_root.parent
+    args = _build_arg_parser().parse_args()
+    configs = _resolve_configs(tb_root=tb_root, args=args)
+    if args.waves:
+        for config in configs:
+            config["waves"] = args.waves
+
+    if not (args.all or args.targets):
+        _run_target(
+            tb_root=tb_root,
+            repo_root=repo_root,
+            config=configs[0],
+            rebuild=args.rebuild,
+            shards=_target_shards(configs[0], args.shards),
+            profile=args.profile,
+            cprofile=args.cprofile,
+        )
+        return
+
+    results = _run_targets_parallel(
+        tb_root=tb_root,
+        repo_root=repo_root,
+        configs=configs,
+        jobs=args.jobs,
+        rebuild=args.rebuild,
+        shards=args.shards,
+        profile=args.profile,
+        cprofile=args.cprofile,
+    )
+    merged_path = tb_root / "sim_build" / "regression_results.xml"
+    merge_results_xml(results, merged_path)
+    print(format_summary(results))
+    print(f"Merged results: {merged_path}")
+
+    if args.profile or args.cprofile:
+        profile_paths = [
+            _target_sim_root(tb_root=tb_root, config=config) / PROFILE_NAME for config in configs
+        ]
+        print(
+            format_profile(TargetProfile.read(path) for path in profile_paths if path.is_file()),
+        )
+
+    if not all(result.passed for result in results):
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge
 from drivers.axi_stream_driver import AxiStreamDriver
+from models.frame_cache import default_frame_cache
 from models.image_model import Image
 from monitors.axi_stream_monitor import AxiStreamMonitor
 from verification.scoreboard import Scoreboard
@@ -86,6 +87,6 @@ async def test_passthrough_single_frame(dut) -> None:
 async def test_passthrough_image_file_roundtrip(dut) -> None:
     input_path = TESTBENCH_ROOT / "images" / "lenna_512_512.png"
     output_path = TESTBENCH_ROOT / "sim_build" / "lenna_512_512_out_rgb.png"
-    image = Image.from_png(input_path)
+    image = default_frame_cache().load_png(input_path)
 
     await run_frame_test(dut=dut, image=image, output_path=output_path)
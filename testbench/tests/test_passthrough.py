@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import ReadOnly, RisingEdge, with_timeout
+from cocotb.triggers import RisingEdge, with_timeout
+from common.offload import Offload
+from common.packing import line_beats
 from common.pause import drive_sink_pause
 from common.reset import apply_reset
+from common.video_timing import VIDEO_TIMINGS, VideoTiming, VideoTimingStats
 from drivers.axis_video_source import AxiVideoStreamSource
+from models.frame_cache import default_frame_cache
+from models.frame_sequence import RawRgb24Sequence
 from models.image_model import Image
+from monitors.axis_protocol_checker import (
+    AxiStreamProtocolChecker,
+    HandshakeStats,
+    ResolveCheck,
+)
 from monitors.axis_video_sink import AxiVideoStreamSink
+from verification.digest_scoreboard import DigestScoreboard
+from verification.frame_stream import check_stream, check_timed_stream, stream_geometry
+from verification.real_time_budget import RealTimeBudget
 from verification.scoreboard import Scoreboard
+from verification.stream_metrics import write_stream_report
 
 I_CLK_SIGNAL = "i_clk"
 I_RST_N_SIGNAL = "i_rst_n"
@@ -51,25 +66,27 @@ class PassthroughCaseConfig:
     handshake_timeout_ns: int = 20_000
     """Timeout for completing protocol-checker observations after frame transfer."""
 
+    fail_fast: bool = True
+    """Check output lines as they arrive and abort on the first mismatching line."""
 
-@dataclass(slots=True)
-class HandshakeStats:
-    """Runtime statistics collected by the output protocol checker."""
-
-    saw_stall: bool = False
-    """True once a `VALID=1, READY=0` cycle is observed on the output stream."""
+    resolve_check: ResolveCheck = "every_cycle"
+    """X/U resolution policy of the protocol checker (`sampled` is cheaper on large frames)."""
 
-    max_ready_low_run: int = 0
-    """Longest consecutive READY-low run seen during the monitored frame."""
+    timing_report: str | None = None
+    """Record beat timestamps and write `<timing_report>.stream_metrics.json` next to results."""
 
-    accepted_beats: int = 0
-    """Count of beats transferred with `VALID && READY` during checking."""
+    real_time_budget: RealTimeBudget | None = None
+    """Fail if the output throughput cannot sustain this resolution/frame rate/clock."""
 
 
 class PassthroughTestbench:
     """Encapsulates setup, traffic, protocol checking, and cleanup."""
 
     def __init__(self, dut, cfg: PassthroughCaseConfig) -> None:
+        if cfg.real_time_budget is not None and not cfg.check_handshake:
+            raise ValueError(
+                "real_time_budget is measured by the protocol checker; enable check_handshake.",
+            )
         self.dut = dut
         self.cfg = cfg
 
@@ -81,11 +98,7 @@ class PassthroughTestbench:
         self.s_axis_tdata = getattr(dut, f"{S_AXIS_PREFIX}_tdata")
         self.s_axis_tlast = getattr(dut, f"{S_AXIS_PREFIX}_tlast")
         self.s_axis_tuser = getattr(dut, f"{S_AXIS_PREFIX}_tuser")
-        self.m_axis_tvalid = getattr(dut, f"{M_AXIS_PREFIX}_tvalid")
         self.m_axis_tready = getattr(dut, f"{M_AXIS_PREFIX}_tready")
-        self.m_axis_tdata = getattr(dut, f"{M_AXIS_PREFIX}_tdata")
-        self.m_axis_tlast = getattr(dut, f"{M_AXIS_PREFIX}_tlast")
-        self.m_axis_tuser = getattr(dut, f"{M_AXIS_PREFIX}_tuser")
 
         self.source: AxiVideoStreamSource | None = None
         self.sink: AxiVideoStreamSink | None = None
@@ -124,6 +137,7 @@ class PassthroughTestbench:
             i_rst_n=self.i_rst_n,
             prefix=S_AXIS_PREFIX,
             reset_active_level=RESET_ACTIVE_LEVEL,
+            record_timestamps=self.cfg.timing_report is not None,
         )
         self.sink = AxiVideoStreamSink(
             dut=self.dut,
@@ -131,14 +145,29 @@ class PassthroughTestbench:
             i_rst_n=self.i_rst_n,
             prefix=M_AXIS_PREFIX,
             reset_active_level=RESET_ACTIVE_LEVEL,
+            record_timestamps=self.cfg.timing_report is not None,
         )
 
-    def _start_optional_tasks(self, *, width: int, height: int) -> None:
+    def _start_optional_tasks(self, *, width: int, height: int, frames: int = 1) -> None:
         """Start optional monitor/backpressure coroutines based on test config."""
         if self.cfg.check_handshake:
-            self._handshake_task = cocotb.start_soon(
-                self._monitor_output_handshake(width=width, height=height),
+            assert self.sink is not None
+            # Fresh statistics per run, so each run is checked independently.
+            self.handshake_stats = HandshakeStats()
+            checker = AxiStreamProtocolChecker(
+                dut=self.dut,
+                i_clk=self.i_clk,
+                i_rst_n=self.i_rst_n,
+                width=width,
+                height=height,
+                frames=frames,
+                pixels_per_clock=self.sink.pixels_per_clock,
+                prefix=M_AXIS_PREFIX,
+                reset_active_level=RESET_ACTIVE_LEVEL,
+                resolve_check=self.cfg.resolve_check,
+                stats=self.handshake_stats,
             )
+            self._handshake_task = cocotb.start_soon(checker.run())
 
         if self.cfg.with_backpressure:
             assert self.sink is not None
@@ -150,7 +179,13 @@ class PassthroughTestbench:
                 ),
             )
 
-    async def _finish_optional_tasks(self, *, width: int, height: int) -> None:
+    async def _finish_optional_tasks(
+        self,
+        *,
+        width: int,
+        height: int,
+        frames: int = 1,
+    ) -> None:
         """Wait for monitor completion and evaluate protocol expectations."""
         if not self.cfg.check_handshake or self._handshake_task is None:
             return
@@ -171,12 +206,23 @@ class PassthroughTestbench:
                 "Expected at least one VALID=1, READY=0 stall cycle."
             )
 
-        expected_beats = width * height
+        assert self.sink is not None
+        expected_beats = line_beats(width, self.sink.pixels_per_clock) * height * frames
         assert self.handshake_stats.accepted_beats == expected_beats, (
             "Output accepted-beat count mismatch. "
             f"observed={self.handshake_stats.accepted_beats}, expected={expected_beats}"
         )
 
+        if self.cfg.real_time_budget is not None:
+            budget = self.cfg.real_time_budget
+            pixels_per_clock = budget.check(self.handshake_stats)
+            self.dut._log.info(
+                "Real-time budget %s met: %.3f px/clk -> %.2f fps",
+                budget.describe(),
+                pixels_per_clock,
+                budget.max_fps(pixels_per_clock),
+            )
+
     def _stop_optional_tasks(self) -> None:
         """Always release background tasks and leave sink unpaused."""
         if self._pause_task is not None:
@@ -190,28 +236,56 @@ class PassthroughTestbench:
         if self.sink is not None:
             self.sink.set_pause(False)
 
+        for endpoint in (self.source, self.sink):
+            if endpoint is not None and endpoint.timestamps is not None:
+                endpoint.timestamps.stop()
+
+    def _write_timing_report(self, *, width: int, height: int, frames: int = 1) -> None:
+        """Export per-frame throughput/latency metrics when `timing_report` is set."""
+        if self.cfg.timing_report is None:
+            return
+        assert self.source is not None and self.source.timestamps is not None
+        assert self.sink is not None and self.sink.timestamps is not None
+
+        write_stream_report(
+            self.cfg.timing_report,
+            inputs=self.source.timestamps,
+            outputs=self.sink.timestamps,
+            clock_period_ns=self.sink.timestamps.clock_period_ns,
+            width=width,
+            height=height,
+            frame_beats=line_beats(width, self.sink.pixels_per_clock) * height,
+            frames=frames,
+            log=self.dut._log,
+        )
+
     async def run_frame(
         self,
         *,
         image: Image,
         output_path: Path | None = None,
     ) -> None:
-        """Execute one send/receive/check cycle for a single frame."""
+        """Execute one send/receive/check cycle for a single frame.
+
+        PNG output and the whole-frame compare run on worker threads while the
+        simulator advances; their results are joined at the end.
+        """
+        offload = Offload()
         await self.initialize()
         assert self.source is not None
         assert self.sink is not None
 
-        if self.cfg.check_handshake:
-            # Reset handshake statistics so each frame is checked independently.
-            self.handshake_stats = HandshakeStats()
         self._start_optional_tasks(width=image.width, height=image.height)
+        send_task = None
         try:
             if self.cfg.check_handshake:
                 # Give pause driving a few cycles to establish deterministic READY patterns.
                 for _ in range(self.cfg.handshake_settle_cycles):
                     await RisingEdge(self.i_clk)
 
-            await self.source.send_image(image)
+            # Receive while the frame is still being sent: a failing line then stops
+            # the test before the rest of the frame has been simulated.
+            send_task = cocotb.start_soon(self.source.send_image(image))
 
             min_timeout_ns = (
                 image.width * image.height * self.cfg.recv_timeout_per_pixel_ns
@@ -220,99 +294,150 @@ class PassthroughTestbench:
                 width=image.width,
                 height=image.height,
                 timeout_ns=max(self.cfg.recv_timeout_floor_ns, min_timeout_ns),
+                on_line=self.scoreboard.line_checker(image) if self.cfg.fail_fast else None,
             )
+            await send_task
 
             if output_path is not None:
-                received_image.to_png(output_path)
+                offload.submit(received_image.to_png, output_path)
 
-            self.scoreboard.compare(expected=image, received=received_image)
+            if not self.cfg.fail_fast:
+                offload.submit(self.scoreboard.compare, expected=image, received=received_image)
             await self._finish_optional_tasks(width=image.width, height=image.height)
+            self._write_timing_report(width=image.width, height=image.height)
+            offload.join()
+        finally:
+            offload.cancel()
+            if send_task is not None and not send_task.done():
+                send_task.cancel()
+            self._stop_optional_tasks()
+
+    async def run_stream(self, *, images: Sequence[Image]) -> None:
+        """Stream frames back to back through one reset and check each frame on arrival."""
+        width, height = stream_geometry(images)
+        await self.initialize()
+        assert self.source is not None
+        assert self.sink is not None
+
+        frames = len(images)
+        offload = Offload()
+        self._start_optional_tasks(width=width, height=height, frames=frames)
+        try:
+            if self.cfg.check_handshake:
+                for _ in range(self.cfg.handshake_settle_cycles):
+                    await RisingEdge(self.i_clk)
+
+            min_timeout_ns = width * height * self.cfg.recv_timeout_per_pixel_ns
+            await check_stream(
+                source=self.source,
+                sink=self.sink,
+                scoreboard=self.scoreboard,
+                images=images,
+                expected=images,
+                timeout_ns=max(self.cfg.recv_timeout_floor_ns, min_timeout_ns),
+                fail_fast=self.cfg.fail_fast,
+                offload=offload,
+                log=self.dut._log,
+            )
+            self._write_timing_report(width=width, height=height, frames=frames)
+            await self._finish_optional_tasks(width=width, height=height, frames=frames)
+            offload.join()
+        finally:
+            offload.cancel()
+            self._stop_optional_tasks()
+
+    async def run_soak(
+        self,
+        *,
+        images: Iterable[Image],
+        width: int,
+        height: int,
+        frames: int,
+    ) -> None:
+        """Stream a lazily generated sequence and check it against CRC32 line digests.
+
+        Neither the inputs nor the received frames are retained, so memory stays
+        constant for arbitrarily long runs; only failing frames are kept.
+        """
+        await self.initialize()
+        assert self.source is not None
+        assert self.sink is not None
+
+        digests = DigestScoreboard()
+        self._start_optional_tasks(width=width, height=height, frames=frames)
+        send_task = None
+        try:
+            if self.cfg.check_handshake:
+                for _ in range(self.cfg.handshake_settle_cycles):
+                    await RisingEdge(self.i_clk)
+
+            send_task = cocotb.start_soon(
+                self.source.send_images(
+                    digests.expect_each(images),
+                    max_queued_lines=2 * height,
+                ),
+            )
+
+            min_timeout_ns = width * height * self.cfg.recv_timeout_per_pixel_ns
+            async for received_image in self.sink.iter_images(
+                width=width,
+                height=height,
+                count=frames,
+                timeout_ns=max(self.cfg.recv_timeout_floor_ns, min_timeout_ns),
+                on_line=digests.check_line,
+            ):
+                digests.finish_frame(received_image)
+
+            digests.assert_clean()
+            await send_task
+            await self._finish_optional_tasks(width=width, height=height, frames=frames)
         finally:
+            if send_task is not None and not send_task.done():
+                send_task.cancel()
             self._stop_optional_tasks()
 
-    async def _monitor_output_handshake(self, *, width: int, height: int) -> None:
-        """Bus-level protocol checker for accepted beats and stall stability."""
-        ready_low_run = 0
-        prev_stall_payload: tuple[int, int, int] | None = None
-        accepted_beats = 0
-        expected_beats = width * height
-
-        while accepted_beats < expected_beats:
-            # Sample in read-only phase so assertions see stable values for this edge.
-            await RisingEdge(self.i_clk)
-            await ReadOnly()
-
-            # Enforce fully resolved outputs at all times (no X/Z/U windows on observed outputs).
-            self._assert_resolved(self.m_axis_tvalid, "m_axis_video_tvalid")
-            self._assert_resolved(self.m_axis_tready, "m_axis_video_tready")
-            self._assert_resolved(self.m_axis_tdata, "m_axis_video_tdata")
-            self._assert_resolved(self.m_axis_tlast, "m_axis_video_tlast")
-            self._assert_resolved(self.m_axis_tuser, "m_axis_video_tuser")
-
-            if int(self.i_rst_n.value) == int(RESET_ACTIVE_LEVEL):
-                ready_low_run = 0
-                prev_stall_payload = None
-                accepted_beats = 0
-                continue
-
-            valid = int(self.m_axis_tvalid.value)
-            ready = int(self.m_axis_tready.value)
-
-            if ready == 0:
-                ready_low_run += 1
-                self.handshake_stats.max_ready_low_run = max(
-                    self.handshake_stats.max_ready_low_run,
-                    ready_low_run,
-                )
-            else:
-                ready_low_run = 0
-
-            if valid == 1 and ready == 1:
-                tuser = int(self.m_axis_tuser.value)
-                tlast = int(self.m_axis_tlast.value)
-
-                expected_sof = 1 if accepted_beats == 0 else 0
-                assert tuser == expected_sof, (
-                    "SOF/TUSER mismatch on accepted output beat "
-                    f"{accepted_beats}: observed={tuser}, expected={expected_sof}"
-                )
-
-                expected_tlast = 1 if ((accepted_beats + 1) % width) == 0 else 0
-                assert tlast == expected_tlast, (
-                    "EOL/TLAST mismatch on accepted output beat "
-                    f"{accepted_beats}: observed={tlast}, expected={expected_tlast}"
-                )
-
-                accepted_beats += 1
-
-            if valid == 1 and ready == 0:
-                # AXI rule: payload/sidebands must remain stable while stalled.
-                self.handshake_stats.saw_stall = True
-                payload = (
-                    int(self.m_axis_tdata.value),
-                    int(self.m_axis_tlast.value),
-                    int(self.m_axis_tuser.value),
-                )
-                if prev_stall_payload is not None:
-                    assert payload == prev_stall_payload, (
-                        "Output payload changed while stalled (VALID=1, READY=0). "
-                        f"prev={prev_stall_payload}, now={payload}"
-                    )
-                prev_stall_payload = payload
-            else:
-                prev_stall_payload = None
-
-        self.handshake_stats.accepted_beats = accepted_beats
-
-    @staticmethod
-    def _assert_resolved(signal, signal_name: str) -> None:
-        """Fail fast if a sampled signal contains non-resolved logic states."""
+    async def run_timed(
+        self,
+        *,
+        images: Sequence[Image],
+        timing: VideoTiming,
+        latency_lines: int = 0,
+    ) -> tuple[VideoTimingStats, VideoTimingStats]:
+        """Feed frames with camera blanking and drain them at display line rate.
+
+        ``latency_lines`` is the DUT's line buffering (see ``check_timed_stream``). This
+        DUT forwards TREADY combinationally and stores no pixels, so the output slot of
+        a line has to coincide with its input slot.
+        """
+        if self.cfg.with_backpressure:
+            raise ValueError("Timed runs pace TREADY themselves; disable with_backpressure.")
+        stream_geometry(images)
+        await self.initialize()
+        assert self.source is not None
+        assert self.sink is not None
+
+        frames = len(images)
+        self._start_optional_tasks(width=timing.width, height=timing.height, frames=frames)
         try:
-            int(signal.value)
-        except Exception as exc:  # pragma: no cover - simulator-value type dependent
-            raise AssertionError(
-                f"{signal_name} is not fully resolved at sample point: {signal.value!s}",
-            ) from exc
+            stats = await check_timed_stream(
+                source=self.source,
+                sink=self.sink,
+                scoreboard=self.scoreboard,
+                images=images,
+                expected=images,
+                timing=timing,
+                latency_lines=latency_lines,
+                timeout_ns=self.cfg.recv_timeout_floor_ns,
+                log=self.dut._log,
+            )
+            await self._finish_optional_tasks(
+                width=timing.width,
+                height=timing.height,
+                frames=frames,
+            )
+            return stats
+        finally:
+            self._stop_optional_tasks()
 
 
 async def run_frame_test(
@@ -355,5 +480,53 @@ async def test_passthrough_image_file_roundtrip(dut) -> None:
     output_path = TESTBENCH_ROOT / "sim_build" / "lenna_512_512_out_rgb.png"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    image = Image.from_png(input_path)
+    image = default_frame_cache().load_png(input_path)
     await run_frame_test(dut=dut, image=image, output_path=output_path)
+
+
+@cocotb.test()
+async def test_passthrough_stream_back_to_back(dut) -> None:
+    """Stream frames without reset, check SOF/EOL per frame and the 1080p60 budget."""
+    cfg = PassthroughCaseConfig(
+        check_handshake=True,
+        timing_report="passthrough_stream",
+        real_time_budget=RealTimeBudget.from_timing(VIDEO_TIMINGS["1080p60"]),
+    )
+    tb = PassthroughTestbench(dut=dut, cfg=cfg)
+    images = [Image.gradient(width=16, height=8, phase=index) for index in range(4)]
+    await tb.run_stream(images=images)
+
+
+@cocotb.test()
+async def test_passthrough_soak_digest(dut) -> None:
+    """Stream a long generated sequence through the constant-memory digest scoreboard."""
+    cfg = PassthroughCaseConfig(check_handshake=True, resolve_check="sampled")
+    tb = PassthroughTestbench(dut=dut, cfg=cfg)
+    frames = 64
+    images = (Image.gradient(width=32, height=8, phase=index) for index in range(frames))
+    await tb.run_soak(images=images, width=32, height=8, frames=frames)
+
+
+@cocotb.test()
+async def test_passthrough_raw_clip_prefetched(dut) -> None:
+    """Stream a raw RGB24 clip decoded on the prefetch thread through the digest scoreboard."""
+    width, height, frames = 32, 8, 16
+    clip_path = TESTBENCH_ROOT / "sim_build" / "clips" / "passthrough_clip_32x8.rgb"
+    clip_path.parent.mkdir(parents=True, exist_ok=True)
+    with clip_path.open("wb") as clip:
+        for index in range(frames):
+            clip.write(Image.gradient(width=width, height=height, phase=index).pixels.tobytes())
+
+    clip = RawRgb24Sequence(clip_path, width=width, height=height)
+    cfg = PassthroughCaseConfig(check_handshake=True, resolve_check="sampled")
+    tb = PassthroughTestbench(dut=dut, cfg=cfg)
+    await tb.run_soak(images=clip.prefetched(), width=width, height=height, frames=len(clip))
+
+
+@cocotb.test()
+async def test_passthrough_video_timing_real_time(dut) -> None:
+    """Camera-paced input and display-rate output with blanking must not miss a line."""
+    timing = VideoTiming("test_32x8", 32, 8, hblank=8, vblank=2, pixel_clock_hz=50e6)
+    tb = PassthroughTestbench(dut=dut, cfg=PassthroughCaseConfig(check_handshake=True))
+    images = [Image.gradient(width=32, height=8, phase=index) for index in range(2)]
+    await tb.run_timed(images=images, timing=timing)
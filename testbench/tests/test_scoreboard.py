@@ -0,0 +1,38 @@
+"""Test layer: simulator-free checks of the frame scoreboard tolerances."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from models.image_model import Image
+from verification.scoreboard import Scoreboard, Tolerance
+
+EXPECTED = Image(pixels=np.full((10, 20, 3), 128, dtype=np.uint8))
+
+
+def _received_with(error: int, pixels: int) -> Image:
+    noisy = EXPECTED.pixels.copy().reshape(-1, 3)
+    noisy[:pixels, 1] += error
+    return Image.wrap(noisy.reshape(EXPECTED.pixels.shape))
+
+
+def _check(scoreboard: Scoreboard, received: Image) -> None:
+    scoreboard.compare(expected=EXPECTED, received=received)
+    line_check = scoreboard.line_checker(EXPECTED)
+    for y, row in enumerate(received.pixels):
+        line_check(y, row)
+
+
+def test_off_by_one_budget_above_max_abs_diff() -> None:
+    """The off-by-one budget must also widen a non-zero `max_abs_diff` by one LSB."""
+    scoreboard = Scoreboard(Tolerance(max_abs_diff=3, off_by_one_percent=5))
+    # 5% of 200 pixels may exceed max_abs_diff=3 by one.
+    _check(scoreboard, _received_with(error=4, pixels=10))
+
+
+@pytest.mark.parametrize(("error", "pixels"), [(5, 1), (4, 11)])
+def test_off_by_one_budget_rejects(error: int, pixels: int) -> None:
+    """Errors beyond one LSB, or more off-by-one pixels than budgeted, must fail."""
+    scoreboard = Scoreboard(Tolerance(max_abs_diff=3, off_by_one_percent=5))
+    with pytest.raises(AssertionError):
+        _check(scoreboard, _received_with(error=error, pixels=pixels))
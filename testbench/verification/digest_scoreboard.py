@@ -0,0 +1,115 @@
+"""Verification layer: constant-memory digest scoreboard for long frame sequences."""
+
+from __future__ import annotations
+
+import zlib
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+import numpy as np
+from models.image_model import Image
+
+
+def line_crc(row: np.ndarray) -> int:
+    """CRC32 of one ``(W, 3)`` uint8 line in RGB byte order."""
+    return zlib.crc32(np.ascontiguousarray(row))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FrameDigest:
+    """Per-line CRC32 values of one golden frame (4 bytes per line)."""
+
+    width: int
+    height: int
+    line_crcs: np.ndarray
+
+    @classmethod
+    def of(cls, image: Image) -> FrameDigest:
+        crcs = np.fromiter(
+            (line_crc(row) for row in image.pixels),
+            dtype=np.uint32,
+            count=image.height,
+        )
+        return cls(width=image.width, height=image.height, line_crcs=crcs)
+
+
+@dataclass(frozen=True, slots=True)
+class DigestMismatch:
+    """A frame whose received lines did not match the golden digests."""
+
+    frame_index: int
+    lines: tuple[int, ...]
+    received: Image | None
+    """Full received frame, kept only for the first ``max_kept_frames`` mismatches."""
+
+
+class DigestScoreboard:
+    """Check frames against precomputed CRC32 digests instead of stored golden pixels.
+
+    Golden frames are reduced to ``FrameDigest`` objects with ``expect`` before they
+    are sent and can be dropped right after. The sink feeds received lines through
+    ``check_line`` (the ``AxiVideoStreamSink.iter_images`` ``on_line`` hook), so
+    memory stays bounded by the in-flight digests plus ``max_kept_frames`` failing
+    frames, independent of the run length.
+    """
+
+    def __init__(self, *, max_kept_frames: int = 4, fail_fast: bool = False) -> None:
+        self.max_kept_frames = max_kept_frames
+        self.fail_fast = fail_fast
+        self.frames_checked = 0
+        self.mismatches: list[DigestMismatch] = []
+        self._pending: deque[FrameDigest] = deque()
+        self._bad_lines: list[int] = []
+
+    def expect(self, image: Image) -> None:
+        """Queue the digest of the next golden frame."""
+        self._pending.append(FrameDigest.of(image))
+
+    def expect_each(self, images: Iterable[Image]) -> Iterator[Image]:
+        """Pass ``images`` through unchanged, digesting each one as it is drawn."""
+        for image in images:
+            self.expect(image)
+            yield image
+
+    def check_line(self, frame_index: int, y: int, row: np.ndarray) -> None:
+        if frame_index != self.frames_checked:
+            raise AssertionError(
+                f"Digest scoreboard out of sync: line of frame {frame_index} arrived while "
+                f"checking frame {self.frames_checked}",
+            )
+        if not self._pending:
+            raise AssertionError(f"Received frame {frame_index} without an expected digest")
+
+        if line_crc(row) == int(self._pending[0].line_crcs[y]):
+            return
+        self._bad_lines.append(y)
+        if self.fail_fast:
+            raise AssertionError(f"Frame {frame_index}: line {y} digest mismatch")
+
+    def finish_frame(self, received: Image) -> None:
+        """Close the current frame; keep its pixels only if a line mismatched."""
+        self._pending.popleft()
+        if self._bad_lines:
+            keep = len(self.mismatches) < self.max_kept_frames
+            self.mismatches.append(
+                DigestMismatch(
+                    frame_index=self.frames_checked,
+                    lines=tuple(self._bad_lines),
+                    received=Image.wrap(received.pixels.copy()) if keep else None,
+                ),
+            )
+            self._bad_lines = []
+        self.frames_checked += 1
+
+    def assert_clean(self) -> None:
+        if not self.mismatches:
+            return
+
+        details = "; ".join(
+            f"frame {mismatch.frame_index}: {len(mismatch.lines)} lines from {mismatch.lines[0]}"
+            for mismatch in self.mismatches[: self.max_kept_frames]
+        )
+        raise AssertionError(
+            f"{len(self.mismatches)}/{self.frames_checked} frames failed digest check ({details})",
+        )
@@ -0,0 +1,156 @@
+"""Verification layer: stream frame sequences through a DUT and check every output frame."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from concurrent.futures import Future
+
+import cocotb
+import numpy as np
+from cocotb.utils import get_sim_time
+from common.offload import Offload, resolve
+from common.video_timing import VideoTiming, VideoTimingStats
+from drivers.axis_video_source import AxiVideoStreamSource
+from models.image_model import Image
+from monitors.axis_video_sink import AxiVideoStreamSink
+from verification.scoreboard import Scoreboard
+
+
+def stream_geometry(images: Sequence[Image]) -> tuple[int, int]:
+    """Return the ``(width, height)`` shared by all frames of a stream."""
+    if not images:
+        raise ValueError("Frame stream must contain at least one image.")
+    width = images[0].width
+    height = images[0].height
+    if any(image.width != width or image.height != height for image in images):
+        raise ValueError("All frames of a stream must share the same geometry.")
+    return width, height
+
+
+async def check_stream(
+    *,
+    source: AxiVideoStreamSource,
+    sink: AxiVideoStreamSink,
+    scoreboard: Scoreboard,
+    images: Sequence[Image],
+    expected: Sequence[Image | Future[Image]],
+    timeout_ns: int,
+    fail_fast: bool,
+    offload: Offload,
+    log: logging.Logger,
+) -> None:
+    """Send ``images`` back to back and check output frame ``k`` against ``expected[k]``.
+
+    With ``fail_fast`` every line is checked as it arrives. Otherwise whole frames
+    are compared on ``offload`` while the next frame is simulated; the caller joins it.
+    ``expected`` entries may be ``Future``s still computing on the worker pool.
+    """
+    if len(expected) != len(images):
+        raise ValueError(f"Got {len(images)} input frames but {len(expected)} expected frames.")
+    width, height = stream_geometry(images)
+    frames = len(images)
+
+    # The DUT stays out of reset and the source queue is never drained between
+    # frames, so frame N+1 follows frame N without an idle gap.
+    send_task = cocotb.start_soon(source.send_images(images))
+    try:
+        start_ns = get_sim_time("ns")
+        line_checks = [scoreboard.line_checker(frame) for frame in expected]
+
+        def check_line(index: int, y: int, row: np.ndarray) -> None:
+            try:
+                line_checks[index](y, row)
+            except AssertionError as exc:
+                raise AssertionError(f"Stream frame {index}: {exc}") from exc
+
+        def compare_frame(index: int, received: Image) -> None:
+            try:
+                scoreboard.compare(expected=resolve(expected[index]), received=received)
+            except AssertionError as exc:
+                raise AssertionError(f"Stream frame {index}: {exc}") from exc
+
+        frame_index = 0
+        async for received_image in sink.iter_images(
+            width=width,
+            height=height,
+            count=frames,
+            timeout_ns=timeout_ns,
+            on_line=check_line if fail_fast else None,
+        ):
+            if not fail_fast:
+                # Compare on a worker while the next frame is being simulated.
+                offload.submit(compare_frame, frame_index, received_image)
+            frame_index += 1
+
+        elapsed_ns = get_sim_time("ns") - start_ns
+        log.info(
+            "Streamed %d frames of %dx%d in %d ns (%.1f ns/frame)",
+            frames,
+            width,
+            height,
+            elapsed_ns,
+            elapsed_ns / frames,
+        )
+        await send_task
+    finally:
+        if not send_task.done():
+            send_task.cancel()
+
+
+async def check_timed_stream(
+    *,
+    source: AxiVideoStreamSource,
+    sink: AxiVideoStreamSink,
+    scoreboard: Scoreboard,
+    images: Sequence[Image],
+    expected: Sequence[Image | Future[Image]],
+    timing: VideoTiming,
+    latency_lines: int,
+    timeout_ns: int,
+    log: logging.Logger,
+) -> tuple[VideoTimingStats, VideoTimingStats]:
+    """Feed ``images`` with camera blanking and drain them at display line rate.
+
+    The sink's line slots trail the source by ``latency_lines`` line periods (the
+    DUT's line buffering). Output lines are checked against ``expected`` (frames or
+    pending ``Future``s) as they arrive. Fails if either side misses a line slot and
+    returns the input/output slack statistics otherwise.
+    """
+    if len(expected) != len(images):
+        raise ValueError(f"Got {len(images)} input frames but {len(expected)} expected frames.")
+
+    start_ns = get_sim_time("ns")
+    source_stats = VideoTimingStats(timing.line_period_ns)
+    sink_stats = VideoTimingStats(timing.line_period_ns)
+    send_task = cocotb.start_soon(
+        source.send_images_timed(images, timing, start_ns=start_ns, stats=source_stats),
+    )
+    try:
+        line_checks = [scoreboard.line_checker(frame) for frame in expected]
+
+        def check_line(index: int, y: int, row: np.ndarray) -> None:
+            try:
+                line_checks[index](y, row)
+            except AssertionError as exc:
+                raise AssertionError(f"Timed frame {index}: {exc}") from exc
+
+        async for _ in sink.iter_images_timed(
+            timing,
+            len(images),
+            start_ns=start_ns + latency_lines * timing.line_period_ns,
+            stats=sink_stats,
+            timeout_ns=timeout_ns,
+            on_line=check_line,
+        ):
+            pass
+        await send_task
+    finally:
+        if not send_task.done():
+            send_task.cancel()
+
+    log.info("%s input: %s", timing.name, source_stats.summary())
+    log.info("%s output: %s", timing.name, sink_stats.summary())
+    source_stats.assert_real_time("Input")
+    sink_stats.assert_real_time("Output")
+    return source_stats, sink_stats
@@ -0,0 +1,66 @@
+"""Verification layer: real-time throughput requirements checked against handshake stats."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from common.video_timing import VideoTiming
+from monitors.axis_protocol_checker import HandshakeStats
+
+
+@dataclass(frozen=True, slots=True)
+class RealTimeBudget:
+    """A throughput requirement such as 1920x1080 at 60 fps on a 148.5 MHz clock.
+
+    Simulation is clock-agnostic, so the DUT is measured in pixels per clock cycle
+    and the budget converts that to the frame rate it would reach in hardware.
+    """
+
+    width: int
+    height: int
+    fps: float
+    clock_hz: float
+
+    @classmethod
+    def from_timing(cls, timing: VideoTiming, clock_hz: float | None = None) -> RealTimeBudget:
+        """Budget of a video mode, by default clocked at its pixel clock."""
+        return cls(
+            width=timing.width,
+            height=timing.height,
+            fps=timing.frame_rate_hz,
+            clock_hz=timing.pixel_clock_hz if clock_hz is None else clock_hz,
+        )
+
+    @property
+    def frame_pixels(self) -> int:
+        return self.width * self.height
+
+    @property
+    def required_pixels_per_clock(self) -> float:
+        return self.frame_pixels * self.fps / self.clock_hz
+
+    def max_fps(self, pixels_per_clock: float) -> float:
+        """Frame rate reached at ``pixels_per_clock`` sustained throughput."""
+        return pixels_per_clock * self.clock_hz / self.frame_pixels
+
+    def describe(self) -> str:
+        return (
+            f"{self.width}x{self.height} @ {self.fps:.2f} fps, {self.clock_hz / 1e6:.2f} MHz "
+            f"(needs {self.required_pixels_per_clock:.3f} px/clk)"
+        )
+
+    def check(self, stats: HandshakeStats) -> float:
+        """Assert the measured output throughput meets the budget; return pixels/clock.
+
+        Throughput is measured from the first to the last accepted output beat, so
+        it only means something when the sink does not throttle the DUT. Pixels are
+        counted per beat, so multi-pixel-per-clock streams are measured correctly.
+        """
+        assert stats.accept_span_cycles > 0, "No accepted output beats to measure."
+        pixels_per_clock = stats.pixels_per_cycle
+        assert pixels_per_clock >= self.required_pixels_per_clock, (
+            f"Real-time budget missed: {pixels_per_clock:.3f} px/clk over "
+            f"{stats.accept_span_cycles} cycles reaches {self.max_fps(pixels_per_clock):.2f} fps, "
+            f"budget is {self.describe()}"
+        )
+        return pixels_per_clock
@@ -1,12 +1,153 @@
-"""Verification layer: minimal frame scoreboard."""
+"""Verification layer: frame scoreboard with mismatch analytics and tolerances."""
 
 from __future__ import annotations
 
+import math
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+
 import numpy as np
+from common.offload import resolve
 from models.image_model import Image
 
+LineCheck = Callable[[int, np.ndarray], None]
+"""Per-line callback ``(y, received_row)`` fed by the sink as each line is decoded."""
+
+CHANNEL_NAMES = ("R", "G", "B")
+
+
+@dataclass(frozen=True, slots=True)
+class Tolerance:
+    """Acceptance criteria for approximate (e.g. filtered) outputs.
+
+    A pixel is in error when any channel differs by more than ``max_abs_diff``. Up to
+    ``off_by_one_percent`` percent of the pixels may additionally be off by one LSB.
+    The default accepts only bit-exact frames.
+    """
+
+    max_abs_diff: int = 0
+    off_by_one_percent: float = 0.0
+
+    @property
+    def sample_limit(self) -> int:
+        """Largest per-sample error that can ever be accepted."""
+        return self.max_abs_diff + 1 if self.off_by_one_percent > 0 else self.max_abs_diff
+
+    def excess_budget(self, pixels: int) -> int:
+        """Number of pixels allowed above ``max_abs_diff`` in a frame of ``pixels``."""
+        return int(pixels * self.off_by_one_percent / 100.0)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class MismatchStats:
+    """Summary of the differences between an expected and a received frame."""
+
+    mismatch_pixels: int
+    """Pixels with at least one differing channel."""
+
+    excess_pixels: int
+    """Pixels whose largest channel error exceeds the tolerance ``max_abs_diff``."""
+
+    max_abs_error: tuple[int, int, int]
+    """Largest absolute error per R/G/B channel."""
+
+    psnr_db: float
+    """Peak signal-to-noise ratio over all samples (``inf`` for identical frames)."""
+
+    line_histogram: np.ndarray
+    """Mismatching pixels per line, shape ``(H,)``."""
+
+    first_mismatch: tuple[int, int, int] | None
+    """``(x, y, channel)`` of the first differing sample in raster order."""
+
+    @property
+    def max_error(self) -> int:
+        return max(self.max_abs_error)
+
+    def summary(self, row_offset: int = 0) -> str:
+        lines = np.flatnonzero(self.line_histogram) + row_offset
+        line_range = f"lines {int(lines[0])}..{int(lines[-1])}" if lines.size else "no lines"
+        errors = ", ".join(
+            f"{name}={value}" for name, value in zip(CHANNEL_NAMES, self.max_abs_error)
+        )
+        return (
+            f"{self.mismatch_pixels} mismatching pixels on {int(lines.size)} {line_range}, "
+            f"{self.excess_pixels} beyond max_abs_diff, max abs error {errors}, "
+            f"PSNR={self.psnr_db:.2f} dB"
+        )
+
+
+def analyze(
+    expected: np.ndarray,
+    received: np.ndarray,
+    tolerance: Tolerance = Tolerance(),
+) -> MismatchStats:
+    """Compute ``MismatchStats`` for two equally shaped ``(H, W, 3)`` uint8 arrays.
+
+    The absolute difference is materialized once as uint8; every statistic is a
+    reduction over it (the error histogram yields the squared-error sum for PSNR).
+    """
+    height, width = expected.shape[:2]
+    diff = np.abs(expected.astype(np.int16) - received).astype(np.uint8)
+
+    pixel_error = diff.max(axis=2)
+    mismatch = pixel_error != 0
+    line_histogram = np.count_nonzero(mismatch, axis=1)
+    max_abs_error = diff.reshape(-1, 3).max(axis=0)
+
+    error_counts = np.bincount(diff.reshape(-1), minlength=256)
+    squared_error = int(error_counts @ (np.arange(256, dtype=np.int64) ** 2))
+    mse = squared_error / diff.size
+    psnr_db = math.inf if mse == 0 else 10.0 * math.log10(255.0**2 / mse)
+
+    first_mismatch = None
+    mismatch_pixels = int(line_histogram.sum())
+    if mismatch_pixels:
+        pixel = int(np.argmax(mismatch.reshape(-1)))
+        y, x = divmod(pixel, width)
+        first_mismatch = (x, y, int(np.argmax(diff[y, x] != 0)))
+
+    return MismatchStats(
+        mismatch_pixels=mismatch_pixels,
+        excess_pixels=int(np.count_nonzero(pixel_error > tolerance.max_abs_diff)),
+        max_abs_error=(int(max_abs_error[0]), int(max_abs_error[1]), int(max_abs_error[2])),
+        psnr_db=psnr_db,
+        line_histogram=line_histogram,
+        first_mismatch=first_mismatch,
+    )
+
+
+def _describe_first_mismatch(
+    expected: np.ndarray,
+    received: np.ndarray,
+    stats: MismatchStats,
+    *,
+    row_offset: int = 0,
+) -> str:
+    assert stats.first_mismatch is not None
+    x, y, c = stats.first_mismatch
+    width = expected.shape[1]
+    exp_px = int(expected[y, x, c])
+    got_px = int(received[y, x, c])
+    ch = CHANNEL_NAMES[c] if c < len(CHANNEL_NAMES) else str(c)
+    idx = (y + row_offset) * width + x
+    return (
+        f"First pixel mismatch at index={idx} (x={x}, y={y + row_offset}, ch={ch}): "
+        f"expected={exp_px}, received={got_px}"
+    )
+
 
 class Scoreboard:
+    def __init__(self, tolerance: Tolerance | None = None) -> None:
+        self.tolerance = tolerance or Tolerance()
+
+    def _accepts(self, stats: MismatchStats, pixels: int) -> bool:
+        return (
+            stats.max_error <= self.tolerance.sample_limit
+            and stats.excess_pixels <= self.tolerance.excess_budget(pixels)
+        )
+
     def compare(self, expected: Image, received: Image) -> None:
         if (
             expected.width != received.width
@@ -22,15 +163,71 @@ class Scoreboard:
         if np.array_equal(expected.pixels, received.pixels):
             return
 
-        mismatch_indices = np.argwhere(expected.pixels != received.pixels)
-        y, x, c = mismatch_indices[0]
-        idx = int(y) * expected.width + int(x)
-        exp_px = int(expected.pixels[y, x, c])
-        got_px = int(received.pixels[y, x, c])
-        channel_names = ("R", "G", "B")
-        ch = channel_names[int(c)] if int(c) < len(channel_names) else str(int(c))
+        stats = analyze(expected.pixels, received.pixels, self.tolerance)
+        if self._accepts(stats, expected.width * expected.height):
+            return
 
         raise AssertionError(
-            f"First pixel mismatch at index={idx} (x={int(x)}, y={int(y)}, ch={ch}): "
-            f"expected={exp_px}, received={got_px}",
+            f"{_describe_first_mismatch(expected.pixels, received.pixels, stats)}; "
+            f"{stats.summary()}",
         )
+
+    def compare_line(self, expected: Image, y: int, received: np.ndarray) -> int:
+        """Check one received ``(W, 3)`` line against row ``y`` of ``expected``.
+
+        Raises on the first line with a sample beyond the tolerance, so the test stops
+        before the rest of the frame is simulated; the message reports how many beats
+        (and therefore at least as many clock cycles, at one pixel per beat) the early
+        abort saved. Returns the number of pixels above ``max_abs_diff`` on this line so
+        callers can track the frame-wide off-by-one budget.
+        """
+        expected_row = expected.pixels[y]
+        if received.shape != expected_row.shape:
+            raise AssertionError(
+                f"Line {y} shape mismatch: expected={expected_row.shape}, "
+                f"received={received.shape}",
+            )
+        if np.array_equal(expected_row, received):
+            return 0
+
+        stats = analyze(expected_row[np.newaxis], received[np.newaxis], self.tolerance)
+        if stats.max_error <= self.tolerance.sample_limit:
+            return stats.excess_pixels
+
+        remaining_lines = expected.height - y - 1
+        saved_cycles = remaining_lines * expected.width
+        first = _describe_first_mismatch(
+            expected_row[np.newaxis],
+            received[np.newaxis],
+            stats,
+            row_offset=y,
+        )
+        raise AssertionError(
+            f"{first}; {stats.summary(row_offset=y)}; "
+            f"aborted on line {y + 1}/{expected.height}, skipping {remaining_lines} lines "
+            f"(>= {saved_cycles} cycles not simulated)",
+        )
+
+    def line_checker(self, expected: Image | Future[Image]) -> LineCheck:
+        """Build a ``LineCheck`` for ``expected`` that also enforces the frame budget.
+
+        ``expected`` may still be computing on a worker; it is only waited for when
+        the first line arrives.
+        """
+        frame: Image | None = None
+        budget = 0
+        excess_pixels = 0
+
+        def check(y: int, received: np.ndarray) -> None:
+            nonlocal frame, budget, excess_pixels
+            if frame is None:
+                frame = resolve(expected)
+                budget = self.tolerance.excess_budget(frame.width * frame.height)
+            excess_pixels += self.compare_line(frame, y, received)
+            if excess_pixels > budget:
+                raise AssertionError(
+                    f"Off-by-one budget exceeded on line {y}: {excess_pixels} pixels beyond "
+                    f"max_abs_diff={self.tolerance.max_abs_diff}, allowed={budget}",
+                )
+
+        return check
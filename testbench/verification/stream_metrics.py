@@ -0,0 +1,159 @@
+"""Verification layer: per-frame throughput and latency metrics from beat timestamps."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from common.timing import BeatTimestampRecorder
+
+TESTBENCH_ROOT = Path(__file__).resolve().parents[1]
+
+
+@dataclass(slots=True)
+class FrameMetrics:
+    """Throughput and latency of one frame, in clock cycles unless noted."""
+
+    frame: int
+    latency_cycles: float
+    """First input beat accepted to first output beat accepted."""
+
+    input_beats_per_cycle: float
+    output_beats_per_cycle: float
+    input_stall_cycles: int
+    """Cycles the DUT held ``s_axis_tready`` low while the source was valid."""
+
+    output_stall_cycles: int
+    """Cycles the sink held ``m_axis_tready`` low while the DUT was valid."""
+
+    inter_frame_gap_cycles: float | None
+    """Idle cycles on the output between the previous frame's last and this frame's first beat."""
+
+
+def _frame_bounds(accepted_ns: np.ndarray, frame_beats: int, frames: int) -> np.ndarray:
+    if accepted_ns.size < frame_beats * frames:
+        raise ValueError(
+            f"Recorded {accepted_ns.size} accepted beats, expected {frame_beats * frames}",
+        )
+    beats = accepted_ns[: frame_beats * frames].reshape(frames, frame_beats)
+    return np.stack((beats[:, 0], beats[:, -1]), axis=1)
+
+
+def _stalls_in(stalled_ns: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+    starts = np.searchsorted(stalled_ns, bounds[:, 0], side="left")
+    ends = np.searchsorted(stalled_ns, bounds[:, 1], side="right")
+    return ends - starts
+
+
+def frame_metrics(
+    *,
+    input_accepted_ns: np.ndarray,
+    input_stalled_ns: np.ndarray,
+    output_accepted_ns: np.ndarray,
+    output_stalled_ns: np.ndarray,
+    clock_period_ns: float,
+    frame_beats: int,
+    frames: int,
+) -> list[FrameMetrics]:
+    """Split recorded beat times into frames of ``frame_beats`` and summarize each."""
+    inputs = _frame_bounds(input_accepted_ns, frame_beats, frames)
+    outputs = _frame_bounds(output_accepted_ns, frame_beats, frames)
+
+    input_span = (inputs[:, 1] - inputs[:, 0]) / clock_period_ns + 1
+    output_span = (outputs[:, 1] - outputs[:, 0]) / clock_period_ns + 1
+    latency = (outputs[:, 0] - inputs[:, 0]) / clock_period_ns
+    gaps = (outputs[1:, 0] - outputs[:-1, 1]) / clock_period_ns - 1
+    input_stalls = _stalls_in(input_stalled_ns, inputs)
+    output_stalls = _stalls_in(output_stalled_ns, outputs)
+
+    return [
+        FrameMetrics(
+            frame=index,
+            latency_cycles=float(latency[index]),
+            input_beats_per_cycle=float(frame_beats / input_span[index]),
+            output_beats_per_cycle=float(frame_beats / output_span[index]),
+            input_stall_cycles=int(input_stalls[index]),
+            output_stall_cycles=int(output_stalls[index]),
+            inter_frame_gap_cycles=float(gaps[index - 1]) if index else None,
+        )
+        for index in range(frames)
+    ]
+
+
+def metrics_dir() -> Path:
+    """Directory of the cocotb ``results.xml`` for the running test (or ``sim_build``)."""
+    results_file = os.getenv("COCOTB_RESULTS_FILE")
+    if results_file:
+        return Path(results_file).resolve().parent
+    return TESTBENCH_ROOT / "sim_build"
+
+
+def write_metrics_json(
+    name: str,
+    metrics: list[FrameMetrics],
+    *,
+    width: int,
+    height: int,
+    clock_period_ns: float,
+) -> Path:
+    """Write ``<results dir>/<name>.stream_metrics.json`` and return its path."""
+    path = metrics_dir() / f"{name}.stream_metrics.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "name": name,
+        "width": width,
+        "height": height,
+        "clock_period_ns": clock_period_ns,
+        "min_output_beats_per_cycle": min(m.output_beats_per_cycle for m in metrics),
+        "max_latency_cycles": max(m.latency_cycles for m in metrics),
+        "frames": [asdict(m) for m in metrics],
+    }
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def write_stream_report(
+    name: str,
+    *,
+    inputs: BeatTimestampRecorder,
+    outputs: BeatTimestampRecorder,
+    clock_period_ns: float | None,
+    width: int,
+    height: int,
+    frame_beats: int,
+    frames: int,
+    log: logging.Logger,
+) -> Path:
+    """Summarize the recorded source (``inputs``) and sink (``outputs``) beats per frame.
+
+    Writes ``<name>.stream_metrics.json`` (see ``write_metrics_json``), logs the
+    worst frame and returns the report path.
+    """
+    assert clock_period_ns, "Clock period was not observed by the beat recorder."
+    metrics = frame_metrics(
+        input_accepted_ns=inputs.accepted_ns,
+        input_stalled_ns=inputs.stalled_ns,
+        output_accepted_ns=outputs.accepted_ns,
+        output_stalled_ns=outputs.stalled_ns,
+        clock_period_ns=clock_period_ns,
+        frame_beats=frame_beats,
+        frames=frames,
+    )
+    path = write_metrics_json(
+        name,
+        metrics,
+        width=width,
+        height=height,
+        clock_period_ns=clock_period_ns,
+    )
+    log.info(
+        "Stream metrics: min %.3f output beats/cycle, max latency %.0f cycles -> %s",
+        min(m.output_beats_per_cycle for m in metrics),
+        max(m.latency_cycles for m in metrics),
+        path,
+    )
+    return path